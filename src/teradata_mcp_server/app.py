@@ -20,11 +20,12 @@ import inspect
 import json
 import os
 import re
+import string
+from collections.abc import Callable
 from contextlib import asynccontextmanager
 from importlib.resources import files as pkg_files
 from typing import Annotated, Any
 
-import yaml
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
 from fastmcp.prompts.prompt import Message, TextContent
@@ -51,8 +52,14 @@ from teradata_mcp_server.tools.utils.queryband import build_queryband
 from teradata_mcp_server.utils import format_text_response, resolve_type_hint, setup_logging
 
 _TOOL_ANNOTATIONS: dict[str, ToolAnnotations] = {
-    "tdvs_grant_user": ToolAnnotations(readOnlyHint=False, destructiveHint=True),
-    "tdvs_revoke_user": ToolAnnotations(readOnlyHint=False, destructiveHint=True),
+    "tdvs_create": ToolAnnotations(readOnlyHint=False, destructiveHint=False),
+    "tdvs_update": ToolAnnotations(readOnlyHint=False, destructiveHint=False),
+    "tdvs_destroy": ToolAnnotations(readOnlyHint=False, destructiveHint=True),
+    "tdvs_grant_user_permission": ToolAnnotations(readOnlyHint=False, destructiveHint=True),
+    "tdvs_revoke_user_permission": ToolAnnotations(readOnlyHint=False, destructiveHint=True),
+    "fs_createDataset": ToolAnnotations(readOnlyHint=False, destructiveHint=False),
+    "rag_Execute_Workflow": ToolAnnotations(readOnlyHint=False, destructiveHint=True),
+    "sql_Execute_Full_Pipeline": ToolAnnotations(readOnlyHint=False, destructiveHint=True),
 }
 
 _PREFIX_ANNOTATIONS: dict[str, ToolAnnotations] = {
@@ -65,6 +72,7 @@ _PREFIX_ANNOTATIONS: dict[str, ToolAnnotations] = {
     "sql_": ToolAnnotations(readOnlyHint=True, idempotentHint=True),
     "plot_": ToolAnnotations(readOnlyHint=True, idempotentHint=True),
     "tdvs_": ToolAnnotations(readOnlyHint=True, idempotentHint=True),
+    "fs_": ToolAnnotations(readOnlyHint=True, idempotentHint=True),
     "bar_": ToolAnnotations(readOnlyHint=False, destructiveHint=True),
     "tdml_": ToolAnnotations(readOnlyHint=False, idempotentHint=True),
 }
@@ -79,6 +87,67 @@ def _annotations_for(tool_name: str) -> ToolAnnotations | None:
     return None
 
 
+# Read-only metadata tools whose responses are served from the response cache.
+_CACHEABLE_TOOLS: frozenset[str] = frozenset(
+    {
+        "base_databaseList",
+        "base_tableList",
+        "base_tableDDL",
+        "base_columnDescription",
+        "base_columnMetadata",
+        # Feature store catalog listings; fs_config (domain, entity, catalogs) is part of the cache key
+        "fs_getDataDomains",
+        "fs_featureStoreContent",
+        "fs_getFeatures",
+    }
+)
+
+_READ_ONLY_SQL = re.compile(r"^\s*(SELECT|SEL|SHOW|HELP|WITH|LOCKING|LOCK)\b", re.IGNORECASE)
+
+
+def _may_modify_metadata(tool_name: str, args: tuple, kwargs: dict) -> bool:
+    """Return True when a tool call may change database objects seen by cached metadata tools.
+
+    SQL is checked against the read-only statement prefixes. Any other tool counts as a
+    write unless its annotations explicitly declare ``readOnlyHint=True``.
+    """
+    sql = kwargs.get("sql", args[0] if args and isinstance(args[0], str) else None)
+    if isinstance(sql, str):
+        return not _READ_ONLY_SQL.match(sql)
+    ann = _annotations_for(tool_name)
+    return ann is None or ann.readOnlyHint is not True
+
+
+def _compile_prompt_template(template: str) -> Callable[[dict[str, Any]], str]:
+    """Pre-split a str.format prompt template into static and field segments.
+
+    Templates that only use plain ``{name}`` fields are rendered with a single
+    ``"".join`` instead of re-parsing the template on every call. Anything more
+    elaborate (attribute/index access, conversions, format specs) falls back to
+    ``str.format`` so rendering behaviour is unchanged.
+    """
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        return lambda kwargs: template.format(**kwargs)
+
+    segments: list[tuple[str, str | None]] = []
+    for literal, field, spec, conversion in parsed:
+        if field is not None and (not field.isidentifier() or spec or conversion):
+            return lambda kwargs: template.format(**kwargs)
+        segments.append((literal, field))
+
+    def render(kwargs: dict[str, Any]) -> str:
+        parts: list[str] = []
+        for literal, field in segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(format(kwargs[field]))
+        return "".join(parts)
+
+    return render
+
+
 def create_mcp_app(settings: Settings):
     """Create and configure the FastMCP app with middleware, tools, prompts, resources."""
     logger = setup_logging(settings.logging_level, settings.mcp_transport)
@@ -189,6 +258,8 @@ def create_mcp_app(settings: Settings):
     async def teradata_lifespan(server):
         # ── Startup ──────────────────────────────────────────────────────
         _state.tdconn = td.TDConn(settings=settings)
+        if settings.pool_prefill > 0:
+            await asyncio.to_thread(_state.tdconn.prefill_pool)
 
         _af_enabled = enable_analytic_functions
         if enable_efs or _af_enabled:
@@ -344,13 +415,23 @@ def create_mcp_app(settings: Settings):
 
     mcp = FastMCP("teradata-mcp-server", lifespan=teradata_lifespan, mask_error_details=True)
 
+    def close_connections() -> None:
+        """Dispose the TDConn pool synchronously (used by the signal fast-path in server.py)."""
+        if _state.tdconn is not None:
+            _state.tdconn.close()
+
+    mcp.close_connections = close_connections  # type: ignore[attr-defined]
+
     # Middleware (auth + request context)
     # Note: registry_load_callback will be set later after load_registry_tools is defined
     from fastmcp.server.middleware.error_handling import ErrorHandlingMiddleware
 
     from teradata_mcp_server.tools.auth_cache import SecureAuthCache
 
+    from teradata_mcp_server.tools.response_cache import ResponseCache
+
     auth_cache = SecureAuthCache(ttl_seconds=settings.auth_cache_ttl)
+    response_cache = ResponseCache(maxsize=settings.response_cache_size, ttl_seconds=settings.response_cache_ttl)
 
     middleware = RequestContextMiddleware(
         logger=logger,
@@ -416,6 +497,33 @@ def create_mcp_app(settings: Settings):
         )
         _fire_hook(hooks.on_tool_call, hook_ctx)
 
+        # Serve read-only metadata tools from the response cache; any call that may
+        # modify database objects invalidates it, both before and after it runs.
+        # Basic-auth calls bypass the cache: they must fail unless the proxy QueryBand is set.
+        is_basic_auth = bool(request_context) and str(getattr(request_context, "auth_scheme", "")).lower() == "basic"
+        cache_name = tool_name.removeprefix("handle_")
+        cache_key = None
+        cache_generation = None
+        invalidate_after = False
+        if response_cache.enabled:
+            if cache_name in _CACHEABLE_TOOLS:
+                if not is_basic_auth:
+                    assume_user = getattr(request_context, "assume_user", None) if request_context else None
+                    cache_key = (
+                        cache_name,
+                        assume_user or get_db_user(),
+                        json.dumps([args, kwargs], sort_keys=True, default=str),
+                    )
+                    cached, cache_generation = response_cache.get(cache_key)
+                    if cached is not None:
+                        result, response = cached
+                        logger.debug("Response cache hit for %s", cache_name)
+                        _fire_hook(hooks.on_tool_result, hook_ctx, result)
+                        return list(response)
+            elif _may_modify_metadata(cache_name, args, kwargs):
+                response_cache.invalidate()
+                invalidate_after = True
+
         try:
             if use_sqla:
                 from sqlalchemy import text
@@ -431,10 +539,10 @@ def create_mcp_app(settings: Settings):
                     )
                     try:
                         conn.execute(text(f"SET QUERY_BAND = '{qb}' FOR SESSION"))
-                        logger.debug(f"QueryBand set: {qb}")
-                        logger.debug(f"Tool request context: {request_context}")
+                        logger.debug("QueryBand set: %s", qb)
+                        logger.debug("Tool request context: %s", request_context)
                     except Exception as qb_error:
-                        logger.debug(f"Could not set QueryBand: {qb_error}")
+                        logger.debug("Could not set QueryBand: %s", qb_error)
                         # If in Basic auth, do not run the tool without proxying
                         if request_context and str(getattr(request_context, "auth_scheme", "")).lower() == "basic":
                             raise ToolError(
@@ -456,10 +564,10 @@ def create_mcp_app(settings: Settings):
                         cursor = raw.cursor()
                         cursor.execute(f"SET QUERY_BAND = '{qb}' FOR SESSION")
                         cursor.close()
-                        logger.debug(f"QueryBand set: {qb}")
-                        logger.debug(f"Tool request context: {request_context}")
+                        logger.debug("QueryBand set: %s", qb)
+                        logger.debug("Tool request context: %s", request_context)
                     except Exception as qb_error:
-                        logger.debug(f"Could not set QueryBand: {qb_error}")
+                        logger.debug("Could not set QueryBand: %s", qb_error)
                         if request_context and str(getattr(request_context, "auth_scheme", "")).lower() == "basic":
                             raise ToolError(
                                 f"Cannot run tool '{tool_name}': failed to set QueryBand for Basic auth. Error: {qb_error}"
@@ -468,7 +576,11 @@ def create_mcp_app(settings: Settings):
                 finally:
                     raw.close()
             _fire_hook(hooks.on_tool_result, hook_ctx, result)
-            return format_text_response(result)
+            response = format_text_response(result)
+            if cache_key is not None:
+                response_cache.set(cache_key, (result, response), cache_generation)
+                return list(response)
+            return response
         except ToolError:
             raise
         except Exception as e:
@@ -477,6 +589,9 @@ def create_mcp_app(settings: Settings):
                 f"Error in execute_db_tool: {e}", exc_info=True, extra={"session_info": {"tool_name": tool_name}}
             )
             raise ToolError(str(e)) from None
+        finally:
+            if invalidate_after:
+                response_cache.invalidate()
 
     def make_tool_wrapper(func):
         """Create an MCP-facing wrapper for a handle_* function.
@@ -552,7 +667,7 @@ def create_mcp_app(settings: Settings):
             """
             try:
                 results = context_catalog.search_tools(query, limit)
-                return format_text_response(json.dumps({"status": "success", "results": results}, default=str))
+                return format_text_response({"status": "success", "results": results})
             except Exception as e:
                 logger.error(f"Error in search_tool: {e}", exc_info=True)
                 raise ToolError(str(e)) from None
@@ -682,7 +797,7 @@ def create_mcp_app(settings: Settings):
             else:
                 with open(file, encoding="utf-8", errors="replace") as f:
                     file_text = f.read()
-            loaded = yaml.safe_load(file_text)
+            loaded = config_loader.safe_load_yaml(file_text)
             if loaded:
                 custom_objects.update(loaded)
         except Exception as e:
@@ -691,9 +806,11 @@ def create_mcp_app(settings: Settings):
     # Prompt helpers
     def make_custom_prompt(prompt_name: str, prompt: str, desc: str, parameters: dict | None = None):
         if parameters is None or len(parameters) == 0:
+            # Zero-argument prompts are constant, build the message once
+            static_message = Message(role="user", content=TextContent(type="text", text=prompt))
 
             async def _dynamic_prompt():
-                return Message(role="user", content=TextContent(type="text", text=prompt))
+                return static_message
 
             _dynamic_prompt.__name__ = prompt_name
             return mcp.prompt(description=desc)(_dynamic_prompt)
@@ -723,6 +840,7 @@ def create_mcp_app(settings: Settings):
                 )
                 annotations[param_name] = type_hint
             sig = inspect.Signature(param_objects)
+            render_prompt = _compile_prompt_template(prompt)
 
             async def _dynamic_prompt_with_params(**kwargs: Any):  # type: ignore[no-untyped-def]
                 missing = [
@@ -732,7 +850,7 @@ def create_mcp_app(settings: Settings):
                 ]
                 if missing:
                     raise ValueError(f"Missing parameters: {missing}")
-                formatted_prompt = prompt.format(**kwargs)
+                formatted_prompt = render_prompt(kwargs)
                 return Message(role="user", content=TextContent(type="text", text=formatted_prompt))
 
             _dynamic_prompt_with_params.__signature__ = sig  # type: ignore[attr-defined]
@@ -808,23 +926,31 @@ def create_mcp_app(settings: Settings):
         # Build signature with correct order: conn, required_custom_params, tool_name, persist (both with defaults), optional_custom_params
         sig = inspect.Signature([parameters[0]] + required_params + [parameters[1], parameters[2]] + optional_params)
 
+        # The SQL template is constant for the tool, so resolve its {placeholder} keys once here
+        # rather than re-scanning the template on every call.
+        sql_template = tool["sql"]
+        uses_format = "{" in sql_template
+        format_keys: frozenset[str] = frozenset()
+        if uses_format:
+            found_keys = set(re.findall(r"\{(\w+)\}", sql_template))
+            # table_ref is a synthetic key built from database_name + table_name; exclude both
+            # source params when table_ref was used, so they aren't passed as SQL bind params.
+            if "table_ref" in found_keys:
+                found_keys.update({"database_name", "table_name"})
+            format_keys = frozenset(found_keys)
+
         # Create the handler function (like handle_* functions)
         def handler(conn: Connection, tool_name=None, **kwargs):
             """Custom YAML-defined query tool handler."""
-            sql = tool["sql"]
+            sql = sql_template
             # Support Python format-string style {param} for identifier substitution (e.g. table names,
             # which cannot be SQLAlchemy bind parameters). When {…} placeholders are detected, format
             # the SQL template first; otherwise fall through to :param bind-parameter style.
-            if "{" in sql:
+            if uses_format:
                 db_name = kwargs.get("database_name") or ""
                 tbl_name = kwargs.get("table_name") or ""
                 fmt = {k: (v if v is not None else "") for k, v in kwargs.items()}
                 fmt["table_ref"] = f"{db_name}.{tbl_name}" if db_name else tbl_name
-                format_keys = set(re.findall(r"\{(\w+)\}", sql))
-                # table_ref is a synthetic key built from database_name + table_name; exclude both
-                # source params when table_ref was used, so they aren't passed as SQL bind params.
-                if "table_ref" in format_keys:
-                    format_keys.update({"database_name", "table_name"})
                 sql = sql.format_map(fmt)
                 bind_kwargs = {k: v for k, v in kwargs.items() if k not in format_keys}
                 return td.handle_base_readQuery(conn, sql, tool_name=tool_name or name, **bind_kwargs)
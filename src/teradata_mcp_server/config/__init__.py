@@ -36,6 +36,7 @@ class Settings:
     pool_size: int = 5
     max_overflow: int = 10
     pool_timeout: int = 30
+    pool_prefill: int = 0  # connections to open concurrently at startup (TD_POOL_PREFILL, capped at pool_size)
 
     # Logging
     logging_level: str = os.getenv("LOGGING_LEVEL", "WARNING")
@@ -50,6 +51,42 @@ class Settings:
     default_row_limit: int = 1000  # Default max rows returned by base_readQuery (DEFAULT_ROW_LIMIT env var)
     max_row_limit: int = 50000  # Hard ceiling; callers cannot exceed this (MAX_ROW_LIMIT env var)
 
+    # Response cache for read-only metadata tools (0 disables)
+    response_cache_ttl: int = 300  # seconds (RESPONSE_CACHE_TTL env var)
+    response_cache_size: int = 1024  # max cached responses (RESPONSE_CACHE_SIZE env var)
+
+
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable, failing fast with a clear message."""
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        raise SystemExit(f"Invalid value for {name}: {raw!r} (expected an integer)") from None
+
+
+def _env_bool(name: str, default: str = "false") -> bool:
+    """Read a boolean environment variable (true/1/yes/on)."""
+    return os.getenv(name, default).strip().lower() in _TRUE_VALUES
+
+
+def validate_settings(settings: Settings) -> Settings:
+    """Validate settings before any server state is created.
+
+    Raises SystemExit so that misconfiguration is reported up front rather than
+    after signal handlers and sockets have been set up.
+    """
+    if settings.mcp_transport != "stdio" and not 0 < settings.mcp_port < 65536:
+        raise SystemExit(
+            f"MCP_PORT must be between 1 and 65535 for {settings.mcp_transport} transport (got {settings.mcp_port})"
+        )
+    return settings
+
 
 def settings_from_env() -> Settings:
     """Create Settings from environment variables only.
@@ -61,21 +98,24 @@ def settings_from_env() -> Settings:
         config_dir=os.getenv("CONFIG_DIR") or None,
         mcp_transport=os.getenv("MCP_TRANSPORT", "stdio").lower(),
         mcp_host=os.getenv("MCP_HOST", "localhost"),
-        mcp_port=int(os.getenv("MCP_PORT", "8001")),
+        mcp_port=_env_int("MCP_PORT", 8001),
         mcp_path=os.getenv("MCP_PATH", "/mcp/"),
-        ping_interval=int(os.getenv("MCP_PING_INTERVAL", "30")),
+        ping_interval=_env_int("MCP_PING_INTERVAL", 30),
         auth_mode=os.getenv("AUTH_MODE", "none").lower(),
-        auth_cache_ttl=int(os.getenv("AUTH_CACHE_TTL", "300")),
+        auth_cache_ttl=_env_int("AUTH_CACHE_TTL", 300),
         logmech=os.getenv("LOGMECH", "TD2"),
         logmech_is_explicit=(os.getenv("LOGMECH") is not None),
-        auth_rate_limit_attempts=int(os.getenv("AUTH_RATE_LIMIT_ATTEMPTS", "5")),
-        auth_rate_limit_window=int(os.getenv("AUTH_RATE_LIMIT_WINDOW", "60")),
-        pool_size=int(os.getenv("TD_POOL_SIZE", "5")),
-        max_overflow=int(os.getenv("TD_MAX_OVERFLOW", "10")),
-        pool_timeout=int(os.getenv("TD_POOL_TIMEOUT", "30")),
+        auth_rate_limit_attempts=_env_int("AUTH_RATE_LIMIT_ATTEMPTS", 5),
+        auth_rate_limit_window=_env_int("AUTH_RATE_LIMIT_WINDOW", 60),
+        pool_size=_env_int("TD_POOL_SIZE", 5),
+        max_overflow=_env_int("TD_MAX_OVERFLOW", 10),
+        pool_timeout=_env_int("TD_POOL_TIMEOUT", 30),
+        pool_prefill=_env_int("TD_POOL_PREFILL", 0),
         logging_level=os.getenv("LOGGING_LEVEL", "WARNING"),
-        progressive_disclosure=os.getenv("PROGRESSIVE_DISCLOSURE", "false").lower() == "true",
+        progressive_disclosure=_env_bool("PROGRESSIVE_DISCLOSURE"),
         hooks_module=os.getenv("HOOKS_MODULE") or None,
-        default_row_limit=int(os.getenv("DEFAULT_ROW_LIMIT", "1000")),
-        max_row_limit=int(os.getenv("MAX_ROW_LIMIT", "50000")),
+        default_row_limit=_env_int("DEFAULT_ROW_LIMIT", 1000),
+        max_row_limit=_env_int("MAX_ROW_LIMIT", 50000),
+        response_cache_ttl=_env_int("RESPONSE_CACHE_TTL", 300),
+        response_cache_size=_env_int("RESPONSE_CACHE_SIZE", 1024),
     )
@@ -16,13 +16,22 @@ logger = logging.getLogger("teradata_mcp_server")
 # Global config directory for convenience
 _global_config_dir: Path | None = None
 
+# Prefer the libyaml-backed C loader when PyYAML was built with it (several times faster
+# than the pure-Python SafeLoader); both resolve the same safe tag set.
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_load_yaml(stream: Any) -> Any:
+    """Parse YAML from a string or file object using the fastest available safe loader."""
+    return yaml.load(stream, Loader=_YamlSafeLoader)
+
 
 def load_yaml(file_path: Path) -> dict[str, Any]:
     """Load YAML file, return empty dict if not found or invalid."""
     try:
         if file_path.exists():
             with open(file_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = safe_load_yaml(f)
                 return data if isinstance(data, dict) else {}
     except Exception as e:
         logger.error(f"Error loading {file_path}: {e}")
@@ -52,7 +61,7 @@ def load_config(
     try:
         pkg_config = pkg_files("teradata_mcp_server.config") / config_name
         if pkg_config.is_file():
-            data = yaml.safe_load(pkg_config.read_text(encoding="utf-8"))
+            data = safe_load_yaml(pkg_config.read_text(encoding="utf-8"))
             if isinstance(data, dict):
                 config.update(data)
                 logger.debug(f"Loaded packaged config: {config_name}")
@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
+import logging
 import os
 import signal
+from collections.abc import Callable
 from pathlib import Path
 
 from dotenv import load_dotenv
 
 from teradata_mcp_server import __version__, config_loader
 from teradata_mcp_server.app import create_mcp_app
-from teradata_mcp_server.config import Settings, settings_from_env
+from teradata_mcp_server.config import Settings, settings_from_env, validate_settings
 from teradata_mcp_server.utils import apply_profile_defaults_to_env
 
 
@@ -52,7 +55,7 @@ def parse_args_to_settings() -> Settings:
     args, _ = parser.parse_known_args()
 
     env = settings_from_env()
-    return Settings(
+    settings = Settings(
         profile=args.profile if args.profile is not None else env.profile,
         database_uri=args.database_uri if args.database_uri is not None else env.database_uri,
         config_dir=args.config_dir if args.config_dir is not None else env.config_dir,
@@ -67,9 +70,37 @@ def parse_args_to_settings() -> Settings:
         logging_level=(args.logging_level or env.logging_level).upper(),
         progressive_disclosure=args.progressive_disclosure or env.progressive_disclosure,
         hooks_module=args.hooks_module if args.hooks_module is not None else env.hooks_module,
+        auth_rate_limit_attempts=env.auth_rate_limit_attempts,
+        auth_rate_limit_window=env.auth_rate_limit_window,
+        pool_size=env.pool_size,
+        max_overflow=env.max_overflow,
+        pool_timeout=env.pool_timeout,
+        pool_prefill=env.pool_prefill,
         default_row_limit=env.default_row_limit,
         max_row_limit=env.max_row_limit,
+        response_cache_ttl=env.response_cache_ttl,
+        response_cache_size=env.response_cache_size,
     )
+    return validate_settings(settings)
+
+
+def _sync_shutdown(
+    sig: signal.Signals, logger: logging.Logger, close_connections: Callable[[], None] | None = None
+) -> None:
+    """Close the connection pool and exit immediately with status 0.
+
+    Registered with loop.add_signal_handler, so it runs as a callback on the
+    event loop: the pool is disposed synchronously in that callback instead
+    of in a scheduled task. Tool calls run in worker threads, so the loop
+    stays free to process the signal while a database call is in progress.
+    """
+    logger.info(f"Received {sig.name}, shutting down")
+    if close_connections is not None:
+        try:
+            close_connections()
+        except Exception as e:
+            logger.error(f"Error closing connections on {sig.name}: {e}")
+    os._exit(0)
 
 
 async def main():
@@ -94,9 +125,10 @@ async def main():
     # Graceful shutdown
     try:
         loop = asyncio.get_running_loop()
+        close_connections = getattr(mcp, "close_connections", None)
         for s in (signal.SIGTERM, signal.SIGINT):
             logger.info(f"Registering signal handler for {s.name}")
-            loop.add_signal_handler(s, lambda s=s: os._exit(0))
+            loop.add_signal_handler(s, functools.partial(_sync_shutdown, s, logger, close_connections))
     except NotImplementedError:
         logger.warning("Signal handling not supported on this platform")
 
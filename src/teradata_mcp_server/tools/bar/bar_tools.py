@@ -3,6 +3,7 @@ BAR (Backup and Restore) Tools for Teradata DSA MCP Server
 
 """
 
+import io
 import json
 import logging
 import os
@@ -10,75 +11,138 @@ from typing import Any
 
 from teradata_mcp_server.tools.utils import create_response
 
-from .dsa_client import dsa_client
+from .dsa_client import get_dsa_client
 
 MAX_PORT = 65535
 
+DISK_FILE_SYSTEM_ENDPOINT = "dsa/components/backup-applications/disk-file-system"
+
+# Shared result formatting
+SEPARATOR = "=" * 50
+DISK_FS_LIST_HEADER = "🗂️ DSA Disk File Systems"
+DISK_FS_CONFIG_HEADER = "🗂️ DSA Disk File System Configuration"
+DISK_FS_DELETE_HEADER = "🗂️ DSA Disk File System Deletion"
+DISK_FS_REMOVE_HEADER = "🗂️ DSA Disk File System Removal"
+DISK_FS_BATCH_CONFIG_HEADER = "🗂️ DSA Disk File System Batch Configuration"
+DISK_FS_BATCH_REMOVE_HEADER = "🗂️ DSA Disk File System Batch Removal"
+
 logger = logging.getLogger("teradata_mcp_server")
 
 
 # ------------------ Disk File System Operations ------------------#
 
 
-def list_disk_file_systems() -> str:
-    """List all configured disk file systems in DSA
+def _format_validation(validation: dict[str, Any]) -> list[str]:
+    """Format a DSA validationlist as result lines (server errors first, then client errors)"""
+    lines = ["", "🔍 Validation Details:"]
+    for error in validation.get("serverValidationList") or ():
+        lines.append(
+            f"❌ Server Error: {error.get('message', 'Unknown error')}\n"
+            f"   Code: {error.get('code', 'N/A')}\n"
+            f"   Status: {error.get('valStatus', 'N/A')}"
+        )
+    lines.extend(
+        f"❌ Client Error: {error.get('message', 'Unknown error')}"
+        for error in validation.get("clientValidationList") or ()
+    )
+    return lines
 
-    Lists all disk file systems configured for backup operations, showing:
-    - File system paths
-    - Maximum files allowed per file system
-    - Configuration status
 
-    Returns:
-        Formatted summary of all disk file systems with their configurations
+def _validate_config_args(file_system_path: str | None, max_files: Any) -> str | None:
+    """Check disk file system config arguments locally before calling DSA
+
+    Returns an error message, or None when the arguments are valid.
     """
+    if not file_system_path or not file_system_path.startswith("/"):
+        return "❌ Error: file_system_path must be an absolute path"
+    if not isinstance(max_files, int) or isinstance(max_files, bool) or max_files <= 0:
+        return "❌ Error: max_files must be a positive integer"
+    return None
+
+
+def _list_disk_file_systems_page(limit: int | None = None, offset: int = 0) -> tuple[str, int | None]:
+    """Format one page of the disk file system listing
+
+    Returns (formatted_text, next_offset); next_offset is None on the last page.
+    """
+    if limit is not None and limit <= 0:
+        return "❌ Error: limit must be a positive integer", None
+    if offset < 0:
+        return "❌ Error: offset must be zero or a positive integer", None
+
     try:
         logger.info("bar: Listing disk file systems via DSA API")
 
         # Make request to DSA API
-        response = dsa_client._make_request(
-            method="GET", endpoint="dsa/components/backup-applications/disk-file-system"
-        )
+        response = get_dsa_client()._make_request(method="GET", endpoint=DISK_FILE_SYSTEM_ENDPOINT)
 
-        logger.debug(f"bar: DSA API response: {response}")
+        logger.debug("bar: DSA API response: %s", response)
 
-        results = []
-        results.append("🗂️ DSA Disk File Systems")
-        results.append("=" * 50)
+        next_offset = None
+        buf = io.StringIO()
+        write = buf.write
+        write(f"{DISK_FS_LIST_HEADER}\n{SEPARATOR}\n")
 
         if response.get("status") == "LIST_DISK_FILE_SYSTEMS_SUCCESSFUL":
             file_systems = response.get("fileSystems", [])
+            total = len(file_systems)
 
             if file_systems:
-                results.append(f"📊 Total File Systems: {len(file_systems)}")
-                results.append("")
-
-                for i, fs in enumerate(file_systems, 1):
-                    results.append(f"🗂️ File System #{i}")
-                    results.append(f"   📁 Path: {fs.get('fileSystemPath', 'N/A')}")
-                    results.append(f"   📄 Max Files: {fs.get('maxFiles', 'N/A')}")
-                    results.append("")
+                write(f"📊 Total File Systems: {total}\n\n")
+                page_end = total if limit is None else min(offset + limit, total)
+                for i in range(offset, page_end):
+                    fs = file_systems[i]
+                    write(
+                        f"🗂️ File System #{i + 1}\n"
+                        f"   📁 Path: {fs.get('fileSystemPath', 'N/A')}\n"
+                        f"   📄 Max Files: {fs.get('maxFiles', 'N/A')}\n\n"
+                    )
+                if limit is not None or offset:
+                    write(f"📄 Showing {offset + 1 if page_end > offset else 0}-{page_end} of {total}\n")
+                    if page_end < total:
+                        next_offset = page_end
+                        write(f"➡️ Next offset: {next_offset}\n")
             else:
-                results.append("📋 No disk file systems configured")
+                write("📋 No disk file systems configured\n")
 
-            results.append("=" * 50)
-            results.append(f"✅ Status: {response.get('status')}")
-            results.append(f"🔍 Found Component: {response.get('foundComponent', False)}")
-            results.append(f"✔️ Valid: {response.get('valid', False)}")
+            write(
+                f"{SEPARATOR}\n"
+                f"✅ Status: {response.get('status')}\n"
+                f"🔍 Found Component: {response.get('foundComponent', False)}\n"
+                f"✔️ Valid: {response.get('valid', False)}"
+            )
 
         else:
-            results.append("❌ Failed to list disk file systems")
-            results.append(f"📊 Status: {response.get('status', 'Unknown')}")
+            write(f"❌ Failed to list disk file systems\n📊 Status: {response.get('status', 'Unknown')}")
             if response.get("validationlist"):
                 validation = response["validationlist"]
                 if validation.get("serverValidationList"):
                     for error in validation["serverValidationList"]:
-                        results.append(f"❌ Error: {error.get('message', 'Unknown error')}")
+                        write(f"\n❌ Error: {error.get('message', 'Unknown error')}")
 
-        return "\n".join(results)
+        return buf.getvalue(), next_offset
 
     except Exception as e:
         logger.error(f"bar: Failed to list disk file systems: {str(e)}")
-        return f"❌ Error listing disk file systems: {str(e)}"
+        return f"❌ Error listing disk file systems: {str(e)}", None
+
+
+def list_disk_file_systems(limit: int | None = None, offset: int = 0) -> str:
+    """List all configured disk file systems in DSA
+
+    Lists all disk file systems configured for backup operations, showing:
+    - File system paths
+    - Maximum files allowed per file system
+    - Configuration status
+
+    Args:
+        limit: Maximum number of file systems to show (default: all)
+        offset: Index of the first file system to show (default: 0)
+
+    Returns:
+        Formatted summary of all disk file systems with their configurations
+    """
+    return _list_disk_file_systems_page(limit, offset)[0]
 
 
 def config_disk_file_system(file_system_path: str, max_files: int) -> str:
@@ -94,14 +158,16 @@ def config_disk_file_system(file_system_path: str, max_files: int) -> str:
     Returns:
         Formatted result of the configuration operation with status and any validation messages
     """
+    error = _validate_config_args(file_system_path, max_files)
+    if error:
+        return error
+
     try:
         logger.info(f"bar: Configuring disk file system: {file_system_path} with max files: {max_files}")
 
-        # First, get the existing file systems
+        # First, get the existing file systems (reuses a very recent GET if there is one)
         try:
-            existing_response = dsa_client._make_request(
-                method="GET", endpoint="dsa/components/backup-applications/disk-file-system"
-            )
+            existing_response = get_dsa_client()._make_request(method="GET", endpoint=DISK_FILE_SYSTEM_ENDPOINT)
 
             existing_file_systems = []
             if existing_response.get("status") == "LIST_DISK_FILE_SYSTEMS_SUCCESSFUL":
@@ -114,23 +180,29 @@ def config_disk_file_system(file_system_path: str, max_files: int) -> str:
             logger.warning(f"bar: Could not retrieve existing file systems: {e}")
             existing_file_systems = []
 
-        # Check if the new file system path already exists and update it, or add it
-        file_systems_to_configure = []
-        path_exists = False
-
-        for fs in existing_file_systems:
-            if fs.get("fileSystemPath") == file_system_path:
-                # Update existing file system
-                file_systems_to_configure.append({"fileSystemPath": file_system_path, "maxFiles": max_files})
-                path_exists = True
-                logger.info(f"bar: Updating existing file system: {file_system_path}")
-            else:
-                # Keep existing file system unchanged
-                file_systems_to_configure.append(fs)
+        # Update the file system in place if the path already exists, otherwise append it
+        by_path = {fs.get("fileSystemPath"): fs for fs in existing_file_systems}
+        existing = by_path.get(file_system_path)
+        if existing is not None and existing.get("maxFiles") == max_files:
+            # Nothing to change, skip the write round trip
+            logger.info(f"bar: Disk file system {file_system_path} already has max files {max_files}, skipping update")
+            return (
+                f"{DISK_FS_CONFIG_HEADER}\n{SEPARATOR}\n"
+                f"📁 File System Path: {file_system_path}\n"
+                f"📄 Max Files: {max_files}\n"
+                f"📊 Total File Systems: {len(by_path)}\n"
+                "🔄 Operation: None (already configured)\n\n"
+                "✅ Disk file system is already configured with these settings\n\n"
+                f"{SEPARATOR}\n"
+                "✅ Disk file system configuration operation completed"
+            )
 
-        # If path doesn't exist, add the new file system
-        if not path_exists:
-            file_systems_to_configure.append({"fileSystemPath": file_system_path, "maxFiles": max_files})
+        path_exists = existing is not None
+        by_path[file_system_path] = {"fileSystemPath": file_system_path, "maxFiles": max_files}
+        file_systems_to_configure = list(by_path.values())
+        if path_exists:
+            logger.info(f"bar: Updating existing file system: {file_system_path}")
+        else:
             logger.info(f"bar: Adding new file system: {file_system_path}")
 
         # Prepare request data with all file systems (existing + new/updated)
@@ -139,52 +211,41 @@ def config_disk_file_system(file_system_path: str, max_files: int) -> str:
         logger.info(f"bar: Configuring {len(file_systems_to_configure)} file systems total")
 
         # Make request to DSA API
-        response = dsa_client._make_request(
-            method="POST", endpoint="dsa/components/backup-applications/disk-file-system", data=request_data
+        response = get_dsa_client()._make_request(method="POST", endpoint=DISK_FILE_SYSTEM_ENDPOINT, data=request_data)
+
+        logger.debug("bar: DSA API response: %s", response)
+
+        buf = io.StringIO()
+        write = buf.write
+        write(
+            f"{DISK_FS_CONFIG_HEADER}\n{SEPARATOR}\n"
+            f"📁 File System Path: {file_system_path}\n"
+            f"📄 Max Files: {max_files}\n"
+            f"📊 Total File Systems: {len(file_systems_to_configure)}\n"
+            f"🔄 Operation: {'Update' if path_exists else 'Add'}\n\n"
         )
 
-        logger.debug(f"bar: DSA API response: {response}")
-
-        results = []
-        results.append("🗂️ DSA Disk File System Configuration")
-        results.append("=" * 50)
-        results.append(f"📁 File System Path: {file_system_path}")
-        results.append(f"📄 Max Files: {max_files}")
-        results.append(f"📊 Total File Systems: {len(file_systems_to_configure)}")
-        results.append(f"🔄 Operation: {'Update' if path_exists else 'Add'}")
-        results.append("")
-
         if response.get("status") == "CONFIG_DISK_FILE_SYSTEM_SUCCESSFUL":
-            results.append("✅ Disk file system configured successfully")
-            results.append(f"📊 Status: {response.get('status')}")
-            results.append(f"✔️ Valid: {response.get('valid', False)}")
+            write(
+                "✅ Disk file system configured successfully\n"
+                f"📊 Status: {response.get('status')}\n"
+                f"✔️ Valid: {response.get('valid', False)}\n"
+            )
 
         else:
-            results.append("❌ Failed to configure disk file system")
-            results.append(f"📊 Status: {response.get('status', 'Unknown')}")
-            results.append(f"✔️ Valid: {response.get('valid', False)}")
+            write(
+                "❌ Failed to configure disk file system\n"
+                f"📊 Status: {response.get('status', 'Unknown')}\n"
+                f"✔️ Valid: {response.get('valid', False)}\n"
+            )
 
             # Show validation errors if any
             if response.get("validationlist"):
-                validation = response["validationlist"]
-                results.append("")
-                results.append("🔍 Validation Details:")
-
-                if validation.get("serverValidationList"):
-                    for error in validation["serverValidationList"]:
-                        results.append(f"❌ Server Error: {error.get('message', 'Unknown error')}")
-                        results.append(f"   Code: {error.get('code', 'N/A')}")
-                        results.append(f"   Status: {error.get('valStatus', 'N/A')}")
+                buf.writelines(f"{line}\n" for line in _format_validation(response["validationlist"]))
 
-                if validation.get("clientValidationList"):
-                    for error in validation["clientValidationList"]:
-                        results.append(f"❌ Client Error: {error.get('message', 'Unknown error')}")
+        write(f"\n{SEPARATOR}\n✅ Disk file system configuration operation completed")
 
-        results.append("")
-        results.append("=" * 50)
-        results.append("✅ Disk file system configuration operation completed")
-
-        return "\n".join(results)
+        return buf.getvalue()
 
     except Exception as e:
         logger.error(f"bar: Failed to configure disk file system: {str(e)}")
@@ -208,55 +269,45 @@ def delete_disk_file_systems() -> str:
         logger.info("bar: Deleting all disk file system configurations via DSA API")
 
         # Make request to DSA API
-        response = dsa_client._make_request(
-            method="DELETE", endpoint="dsa/components/backup-applications/disk-file-system"
-        )
+        response = get_dsa_client()._make_request(method="DELETE", endpoint=DISK_FILE_SYSTEM_ENDPOINT)
 
-        logger.debug(f"bar: DSA API response: {response}")
+        logger.debug("bar: DSA API response: %s", response)
 
-        results = []
-        results.append("🗂️ DSA Disk File System Deletion")
-        results.append("=" * 50)
+        buf = io.StringIO()
+        write = buf.write
+        write(f"{DISK_FS_DELETE_HEADER}\n{SEPARATOR}\n")
 
         if response.get("status") == "DELETE_COMPONENT_SUCCESSFUL":
-            results.append("✅ All disk file systems deleted successfully")
-            results.append(f"📊 Status: {response.get('status')}")
-            results.append(f"✔️ Valid: {response.get('valid', False)}")
+            write(
+                "✅ All disk file systems deleted successfully\n"
+                f"📊 Status: {response.get('status')}\n"
+                f"✔️ Valid: {response.get('valid', False)}\n"
+            )
 
         else:
-            results.append("❌ Failed to delete disk file systems")
-            results.append(f"📊 Status: {response.get('status', 'Unknown')}")
-            results.append(f"✔️ Valid: {response.get('valid', False)}")
+            write(
+                "❌ Failed to delete disk file systems\n"
+                f"📊 Status: {response.get('status', 'Unknown')}\n"
+                f"✔️ Valid: {response.get('valid', False)}\n"
+            )
 
             # Show validation errors if any
             if response.get("validationlist"):
                 validation = response["validationlist"]
-                results.append("")
-                results.append("🔍 Validation Details:")
-
-                if validation.get("serverValidationList"):
-                    for error in validation["serverValidationList"]:
-                        results.append(f"❌ Server Error: {error.get('message', 'Unknown error')}")
-                        results.append(f"   Code: {error.get('code', 'N/A')}")
-                        results.append(f"   Status: {error.get('valStatus', 'N/A')}")
-
-                if validation.get("clientValidationList"):
-                    for error in validation["clientValidationList"]:
-                        results.append(f"❌ Client Error: {error.get('message', 'Unknown error')}")
+                buf.writelines(f"{line}\n" for line in _format_validation(validation))
 
                 # If deletion failed due to dependencies, provide guidance
                 if any("in use by" in error.get("message", "") for error in validation.get("serverValidationList", [])):
-                    results.append("")
-                    results.append("💡 Helpful Notes:")
-                    results.append("   • Remove all backup jobs using these file systems first")
-                    results.append("   • Delete any file target groups that reference these file systems")
-                    results.append("   • Use list_disk_file_systems() to see current configurations")
+                    write(
+                        "\n💡 Helpful Notes:\n"
+                        "   • Remove all backup jobs using these file systems first\n"
+                        "   • Delete any file target groups that reference these file systems\n"
+                        "   • Use list_disk_file_systems() to see current configurations\n"
+                    )
 
-        results.append("")
-        results.append("=" * 50)
-        results.append("✅ Disk file system deletion operation completed")
+        write(f"\n{SEPARATOR}\n✅ Disk file system deletion operation completed")
 
-        return "\n".join(results)
+        return buf.getvalue()
 
     except Exception as e:
         logger.error(f"bar: Failed to delete disk file systems: {str(e)}")
@@ -283,11 +334,9 @@ def remove_disk_file_system(file_system_path: str) -> str:
     try:
         logger.info(f"bar: Removing disk file system: {file_system_path}")
 
-        # First, get the existing file systems
+        # First, get the existing file systems (reuses a very recent GET if there is one)
         try:
-            existing_response = dsa_client._make_request(
-                method="GET", endpoint="dsa/components/backup-applications/disk-file-system"
-            )
+            existing_response = get_dsa_client()._make_request(method="GET", endpoint=DISK_FILE_SYSTEM_ENDPOINT)
 
             existing_file_systems = []
             if existing_response.get("status") == "LIST_DISK_FILE_SYSTEMS_SUCCESSFUL":
@@ -302,34 +351,27 @@ def remove_disk_file_system(file_system_path: str) -> str:
             return f"❌ Error retrieving existing file systems: {str(e)}"
 
         # Check if the file system to remove exists
-        path_exists = False
-        file_systems_to_keep = []
-
-        for fs in existing_file_systems:
-            if fs.get("fileSystemPath") == file_system_path:
-                path_exists = True
-                logger.info(f"bar: Found file system to remove: {file_system_path}")
-            else:
-                # Keep this file system
-                file_systems_to_keep.append(fs)
+        by_path = {fs.get("fileSystemPath"): fs for fs in existing_file_systems}
 
         # If path doesn't exist, return error
-        if not path_exists:
-            available_paths = [fs.get("fileSystemPath", "N/A") for fs in existing_file_systems]
-            results = []
-            results.append("🗂️ DSA Disk File System Removal")
-            results.append("=" * 50)
-            results.append(f"❌ File system '{file_system_path}' not found")
-            results.append("")
-            results.append("📋 Available file systems:")
-            if available_paths:
-                for path in available_paths:
-                    results.append(f"   • {path}")
+        if by_path.pop(file_system_path, None) is None:
+            buf = io.StringIO()
+            write = buf.write
+            write(
+                f"{DISK_FS_REMOVE_HEADER}\n{SEPARATOR}\n"
+                f"❌ File system '{file_system_path}' not found\n\n"
+                "📋 Available file systems:\n"
+            )
+            if by_path:
+                for path in by_path:
+                    write(f"   • {path or 'N/A'}\n")
             else:
-                results.append("   (No file systems configured)")
-            results.append("")
-            results.append("=" * 50)
-            return "\n".join(results)
+                write("   (No file systems configured)\n")
+            write(f"\n{SEPARATOR}")
+            return buf.getvalue()
+
+        logger.info(f"bar: Found file system to remove: {file_system_path}")
+        file_systems_to_keep = list(by_path.values())
 
         # Prepare request data with remaining file systems
         request_data = {"fileSystems": file_systems_to_keep}
@@ -337,69 +379,281 @@ def remove_disk_file_system(file_system_path: str) -> str:
         logger.info(f"bar: Removing '{file_system_path}', keeping {len(file_systems_to_keep)} file systems")
 
         # Make request to DSA API to reconfigure with remaining file systems
-        response = dsa_client._make_request(
-            method="POST", endpoint="dsa/components/backup-applications/disk-file-system", data=request_data
-        )
+        response = get_dsa_client()._make_request(method="POST", endpoint=DISK_FILE_SYSTEM_ENDPOINT, data=request_data)
 
-        logger.debug(f"bar: DSA API response: {response}")
+        logger.debug("bar: DSA API response: %s", response)
 
-        results = []
-        results.append("🗂️ DSA Disk File System Removal")
-        results.append("=" * 50)
-        results.append(f"📁 Removed File System: {file_system_path}")
-        results.append(f"📊 Remaining File Systems: {len(file_systems_to_keep)}")
-        results.append("")
+        buf = io.StringIO()
+        write = buf.write
+        write(
+            f"{DISK_FS_REMOVE_HEADER}\n{SEPARATOR}\n"
+            f"📁 Removed File System: {file_system_path}\n"
+            f"📊 Remaining File Systems: {len(file_systems_to_keep)}\n\n"
+        )
 
         if response.get("status") == "CONFIG_DISK_FILE_SYSTEM_SUCCESSFUL":
-            results.append("✅ Disk file system removed successfully")
-            results.append(f"📊 Status: {response.get('status')}")
-            results.append(f"✔️ Valid: {response.get('valid', False)}")
+            write(
+                "✅ Disk file system removed successfully\n"
+                f"📊 Status: {response.get('status')}\n"
+                f"✔️ Valid: {response.get('valid', False)}\n"
+            )
 
             if file_systems_to_keep:
-                results.append("")
-                results.append("📋 Remaining file systems:")
+                write("\n📋 Remaining file systems:\n")
                 for fs in file_systems_to_keep:
-                    path = fs.get("fileSystemPath", "N/A")
-                    max_files = fs.get("maxFiles", "N/A")
-                    results.append(f"   • {path} (Max Files: {max_files})")
+                    write(f"   • {fs.get('fileSystemPath', 'N/A')} (Max Files: {fs.get('maxFiles', 'N/A')})\n")
             else:
-                results.append("")
-                results.append("📋 No file systems remaining (all removed)")
+                write("\n📋 No file systems remaining (all removed)\n")
 
         else:
-            results.append("❌ Failed to remove disk file system")
-            results.append(f"📊 Status: {response.get('status', 'Unknown')}")
-            results.append(f"✔️ Valid: {response.get('valid', False)}")
+            write(
+                "❌ Failed to remove disk file system\n"
+                f"📊 Status: {response.get('status', 'Unknown')}\n"
+                f"✔️ Valid: {response.get('valid', False)}\n"
+            )
 
             # Show validation errors if any
             if response.get("validationlist"):
-                validation = response["validationlist"]
-                results.append("")
-                results.append("🔍 Validation Details:")
+                buf.writelines(f"{line}\n" for line in _format_validation(response["validationlist"]))
 
-                if validation.get("serverValidationList"):
-                    for error in validation["serverValidationList"]:
-                        results.append(f"❌ Server Error: {error.get('message', 'Unknown error')}")
-                        results.append(f"   Code: {error.get('code', 'N/A')}")
-                        results.append(f"   Status: {error.get('valStatus', 'N/A')}")
+        write(f"\n{SEPARATOR}\n✅ Disk file system removal operation completed")
 
-                if validation.get("clientValidationList"):
-                    for error in validation["clientValidationList"]:
-                        results.append(f"❌ Client Error: {error.get('message', 'Unknown error')}")
-
-        results.append("")
-        results.append("=" * 50)
-        results.append("✅ Disk file system removal operation completed")
-
-        return "\n".join(results)
+        return buf.getvalue()
 
     except Exception as e:
         logger.error(f"bar: Failed to remove disk file system: {str(e)}")
         return f"❌ Error removing disk file system '{file_system_path}': {str(e)}"
 
 
-def manage_dsa_disk_file_systems(
-    operation: str, file_system_path: str | None = None, max_files: int | None = None
+def batch_config_disk_file_systems(entries: list[dict[str, Any]]) -> str:
+    """Configure several disk file systems in DSA with a single POST
+
+    Reads the existing file systems once, applies every add/update locally and
+    writes the merged list back in one request, instead of one read-modify-write
+    round trip per file system.
+
+    Args:
+        entries: File systems to add or update, each {"fileSystemPath": str, "maxFiles": int}
+
+    Returns:
+        Formatted result of the batch configuration, listing entries in request order
+    """
+    try:
+        logger.info(f"bar: Batch configuring {len(entries)} disk file systems")
+
+        # The POST replaces the whole list, so without the current list it would drop every other file system
+        try:
+            existing_response = get_dsa_client()._make_request(method="GET", endpoint=DISK_FILE_SYSTEM_ENDPOINT)
+            if existing_response.get("status") != "LIST_DISK_FILE_SYSTEMS_SUCCESSFUL":
+                logger.warning("bar: Unable to retrieve existing file systems")
+                return "❌ Could not retrieve existing file systems to configure"
+            existing_file_systems = existing_response.get("fileSystems", [])
+            logger.info(f"bar: Found {len(existing_file_systems)} existing file systems")
+        except Exception as e:
+            logger.error(f"bar: Could not retrieve existing file systems: {e}")
+            return f"❌ Error retrieving existing file systems: {str(e)}"
+
+        # Merge all upserts locally, keeping the existing order and appending new paths
+        by_path = {fs.get("fileSystemPath"): fs for fs in existing_file_systems}
+        operations = []
+        for entry in entries:
+            path = entry["fileSystemPath"]
+            max_files = entry["maxFiles"]
+            existing = by_path.get(path)
+            if existing is None:
+                operation = "Add"
+            elif existing.get("maxFiles") == max_files:
+                operation = "Unchanged"
+            else:
+                operation = "Update"
+            operations.append((path, max_files, operation))
+            by_path[path] = {"fileSystemPath": path, "maxFiles": max_files}
+
+        file_systems_to_configure = list(by_path.values())
+
+        if all(operation == "Unchanged" for _, _, operation in operations):
+            # Every entry already matches DSA, skip the write round trip
+            logger.info(f"bar: All {len(entries)} disk file systems already configured, skipping update")
+            return (
+                f"{DISK_FS_BATCH_CONFIG_HEADER}\n{SEPARATOR}\n"
+                f"📊 Requested File Systems: {len(entries)}\n"
+                f"📊 Total File Systems: {len(file_systems_to_configure)}\n\n"
+                "✅ All requested disk file systems are already configured with these settings\n\n"
+                f"{SEPARATOR}\n"
+                "✅ Disk file system batch configuration operation completed"
+            )
+
+        request_data = {"fileSystems": file_systems_to_configure}
+
+        response = get_dsa_client()._make_request(method="POST", endpoint=DISK_FILE_SYSTEM_ENDPOINT, data=request_data)
+
+        logger.debug("bar: DSA API response: %s", response)
+
+        buf = io.StringIO()
+        write = buf.write
+        write(
+            f"{DISK_FS_BATCH_CONFIG_HEADER}\n{SEPARATOR}\n"
+            f"📊 Requested File Systems: {len(entries)}\n"
+            f"📊 Total File Systems: {len(file_systems_to_configure)}\n\n"
+        )
+        for path, max_files, operation in operations:
+            write(f"   • {path} (Max Files: {max_files}) - {operation}\n")
+        write("\n")
+
+        if response.get("status") == "CONFIG_DISK_FILE_SYSTEM_SUCCESSFUL":
+            write(
+                "✅ Disk file systems configured successfully\n"
+                f"📊 Status: {response.get('status')}\n"
+                f"✔️ Valid: {response.get('valid', False)}\n"
+            )
+
+        else:
+            write(
+                "❌ Failed to configure disk file systems\n"
+                f"📊 Status: {response.get('status', 'Unknown')}\n"
+                f"✔️ Valid: {response.get('valid', False)}\n"
+            )
+
+            # Show validation errors if any
+            if response.get("validationlist"):
+                buf.writelines(f"{line}\n" for line in _format_validation(response["validationlist"]))
+
+        write(f"\n{SEPARATOR}\n✅ Disk file system batch configuration operation completed")
+
+        return buf.getvalue()
+
+    except Exception as e:
+        logger.error(f"bar: Failed to batch configure disk file systems: {str(e)}")
+        return f"❌ Error batch configuring disk file systems: {str(e)}"
+
+
+def batch_remove_disk_file_systems(file_system_paths: list[str]) -> str:
+    """Remove several disk file systems from DSA configuration with a single POST
+
+    Reads the existing file systems once, drops every requested path locally and
+    writes the remaining list back in one request.
+
+    Args:
+        file_system_paths: Full paths of the file systems to remove
+
+    Returns:
+        Formatted result of the batch removal, listing paths in request order
+    """
+    try:
+        logger.info(f"bar: Batch removing {len(file_system_paths)} disk file systems")
+
+        try:
+            existing_response = get_dsa_client()._make_request(method="GET", endpoint=DISK_FILE_SYSTEM_ENDPOINT)
+            if existing_response.get("status") != "LIST_DISK_FILE_SYSTEMS_SUCCESSFUL":
+                logger.warning("bar: No existing file systems found or unable to retrieve them")
+                return "❌ Could not retrieve existing file systems to remove"
+            existing_file_systems = existing_response.get("fileSystems", [])
+            logger.info(f"bar: Found {len(existing_file_systems)} existing file systems")
+        except Exception as e:
+            logger.error(f"bar: Could not retrieve existing file systems: {e}")
+            return f"❌ Error retrieving existing file systems: {str(e)}"
+
+        by_path = {fs.get("fileSystemPath"): fs for fs in existing_file_systems}
+        outcomes = [(path, by_path.pop(path, None) is not None) for path in file_system_paths]
+        removed_count = sum(1 for _, removed in outcomes if removed)
+
+        buf = io.StringIO()
+        write = buf.write
+        write(f"{DISK_FS_BATCH_REMOVE_HEADER}\n{SEPARATOR}\n")
+        for path, removed in outcomes:
+            write(f"   • {path} - {'Removed' if removed else 'Not found'}\n")
+        write("\n")
+
+        # Nothing to remove: skip the POST entirely
+        if not removed_count:
+            write("❌ None of the requested file systems were found\n\n📋 Available file systems:\n")
+            if by_path:
+                for path in by_path:
+                    write(f"   • {path}\n")
+            else:
+                write("   (No file systems configured)\n")
+            write(f"\n{SEPARATOR}")
+            return buf.getvalue()
+
+        file_systems_to_keep = list(by_path.values())
+        request_data = {"fileSystems": file_systems_to_keep}
+
+        response = get_dsa_client()._make_request(method="POST", endpoint=DISK_FILE_SYSTEM_ENDPOINT, data=request_data)
+
+        logger.debug("bar: DSA API response: %s", response)
+
+        write(f"📁 Removed File Systems: {removed_count}\n📊 Remaining File Systems: {len(file_systems_to_keep)}\n\n")
+
+        if response.get("status") == "CONFIG_DISK_FILE_SYSTEM_SUCCESSFUL":
+            write(
+                "✅ Disk file systems removed successfully\n"
+                f"📊 Status: {response.get('status')}\n"
+                f"✔️ Valid: {response.get('valid', False)}\n"
+            )
+
+        else:
+            write(
+                "❌ Failed to remove disk file systems\n"
+                f"📊 Status: {response.get('status', 'Unknown')}\n"
+                f"✔️ Valid: {response.get('valid', False)}\n"
+            )
+
+            # Show validation errors if any
+            if response.get("validationlist"):
+                buf.writelines(f"{line}\n" for line in _format_validation(response["validationlist"]))
+
+        write(f"\n{SEPARATOR}\n✅ Disk file system batch removal operation completed")
+
+        return buf.getvalue()
+
+    except Exception as e:
+        logger.error(f"bar: Failed to batch remove disk file systems: {str(e)}")
+        return f"❌ Error batch removing disk file systems: {str(e)}"
+
+
+def _parse_file_systems_arg(file_systems: str | list | None, operation: str) -> tuple[list | None, str | None]:
+    """Parse the JSON file_systems argument used by the batch operations
+
+    Returns (parsed_list, error_message); exactly one of them is None.
+    """
+    if not file_systems:
+        return None, f"❌ Error: file_systems is required for {operation} operation"
+    if isinstance(file_systems, str):
+        try:
+            file_systems = json.loads(file_systems)
+        except json.JSONDecodeError as e:
+            return None, f"❌ Error: Invalid file_systems format: {str(e)}"
+    if not isinstance(file_systems, list) or not file_systems:
+        return None, "❌ Error: file_systems must be a non-empty JSON list"
+
+    if operation == "batch_config":
+        entries = []
+        for item in file_systems:
+            if not isinstance(item, dict) or not item.get("fileSystemPath") or item.get("maxFiles") is None:
+                return None, (
+                    "❌ Error: each batch_config entry needs fileSystemPath and maxFiles, e.g. "
+                    '\'[{"fileSystemPath": "/var/opt/teradata/backup", "maxFiles": 100}]\''
+                )
+            error = _validate_config_args(item["fileSystemPath"], item["maxFiles"])
+            if error:
+                return None, f"{error} ({item['fileSystemPath']})"
+            entries.append({"fileSystemPath": item["fileSystemPath"], "maxFiles": item["maxFiles"]})
+        return entries, None
+
+    # batch_remove accepts plain paths or {"fileSystemPath": ...} objects
+    paths = [item.get("fileSystemPath") if isinstance(item, dict) else item for item in file_systems]
+    if not all(isinstance(path, str) and path for path in paths):
+        return None, "❌ Error: batch_remove expects a list of paths, e.g. '[\"/var/opt/teradata/backup\"]'"
+    return paths, None
+
+
+def manage_dsa_disk_file_systems(  # noqa: PLR0917
+    operation: str,
+    file_system_path: str | None = None,
+    max_files: int | None = None,
+    file_systems: str | list | None = None,
+    limit: int | None = None,
+    offset: int = 0,
 ) -> str:
     """Unified DSA Disk File System Management Tool
 
@@ -410,12 +664,17 @@ def manage_dsa_disk_file_systems(
         operation: The operation to perform
         file_system_path: Path to the file system (for config and remove operations)
         max_files: Maximum number of files allowed (for config operation)
+        file_systems: JSON list of file systems (for batch_config and batch_remove operations)
+        limit: Maximum number of file systems to show (for list operation)
+        offset: Index of the first file system to show (for list operation)
 
     Available Operations:
         - "list" - List all configured disk file systems
         - "config" - Configure a new disk file system
         - "delete_all" - Remove all file system configurations
         - "remove" - Remove a specific file system configuration
+        - "batch_config" - Configure several file systems in one request
+        - "batch_remove" - Remove several file systems in one request
 
     Returns:
         Result of the requested operation
@@ -426,7 +685,7 @@ def manage_dsa_disk_file_systems(
     try:
         # List operation
         if operation == "list":
-            return list_disk_file_systems()
+            return list_disk_file_systems(limit=limit, offset=offset)
 
         # Config operation
         elif operation == "config":
@@ -434,6 +693,9 @@ def manage_dsa_disk_file_systems(
                 return "❌ Error: file_system_path is required for config operation"
             if max_files is None:
                 return "❌ Error: max_files is required for config operation"
+            error = _validate_config_args(file_system_path, max_files)
+            if error:
+                return error
             return config_disk_file_system(file_system_path, max_files)
 
         # Delete all operation
@@ -446,8 +708,21 @@ def manage_dsa_disk_file_systems(
                 return "❌ Error: file_system_path is required for remove operation"
             return remove_disk_file_system(file_system_path)
 
+        # Batch operations: one read and one write for many file systems
+        elif operation == "batch_config":
+            entries, error = _parse_file_systems_arg(file_systems, operation)
+            if error:
+                return error
+            return batch_config_disk_file_systems(entries or [])
+
+        elif operation == "batch_remove":
+            paths, error = _parse_file_systems_arg(file_systems, operation)
+            if error:
+                return error
+            return batch_remove_disk_file_systems(paths or [])
+
         else:
-            available_operations = ["list", "config", "delete_all", "remove"]
+            available_operations = ["list", "config", "delete_all", "remove", "batch_config", "batch_remove"]
             return f"❌ Error: Unknown operation '{operation}'. Available operations: {', '.join(available_operations)}"
 
     except Exception as e:
@@ -477,14 +752,14 @@ def list_aws_s3_backup_configurations() -> str:
         logger.info("bar: Listing AWS S3 target systems via DSA API")
 
         # Make request to DSA API
-        response = dsa_client._make_request(method="GET", endpoint="dsa/components/backup-applications/aws-s3")
+        response = get_dsa_client()._make_request(method="GET", endpoint="dsa/components/backup-applications/aws-s3")
 
         # Add debug log for full API response
         logger.debug("bar: Full DSA API response from aws-s3 endpoint: %r", response)
 
         results = []
         results.append("🗂️ DSA AWS S3 Backup Solution Systems Available")
-        results.append("=" * 50)
+        results.append(SEPARATOR)
 
         if response.get("status") == "LIST_AWS_APP_SUCCESSFUL":
             # Extract all AWS configurations from the aws list
@@ -550,7 +825,7 @@ def list_aws_s3_backup_configurations() -> str:
             else:
                 results.append("📋 No AWS backup Solutions Configured")
 
-            results.append("=" * 50)
+            results.append(SEPARATOR)
             results.append(f"✅ Status: {response.get('status')}")
             results.append(f"🔍 Found Component: {response.get('foundComponent', False)}")
             results.append(f"✔️ Valid: {response.get('valid', False)}")
@@ -588,13 +863,13 @@ def delete_aws_s3_backup_configurations() -> str:
         logger.info("bar: Deleting all AWS S3 backup configurations via DSA API")
 
         # Make request to DSA API
-        response = dsa_client._make_request(method="DELETE", endpoint="dsa/components/backup-applications/aws-s3")
+        response = get_dsa_client()._make_request(method="DELETE", endpoint="dsa/components/backup-applications/aws-s3")
 
-        logger.debug(f"bar: DSA API response: {response}")
+        logger.debug("bar: DSA API response: %s", response)
 
         results = []
         results.append("🗂️ DSA AWS S3 Backup Configuration Deletion")
-        results.append("=" * 50)
+        results.append(SEPARATOR)
 
         if response.get("status") == "DELETE_COMPONENT_SUCCESSFUL":
             results.append("✅ All AWS S3 backup configurations deleted successfully")
@@ -609,18 +884,7 @@ def delete_aws_s3_backup_configurations() -> str:
             # Show validation errors if any
             if response.get("validationlist"):
                 validation = response["validationlist"]
-                results.append("")
-                results.append("🔍 Validation Details:")
-
-                if validation.get("serverValidationList"):
-                    for error in validation["serverValidationList"]:
-                        results.append(f"❌ Server Error: {error.get('message', 'Unknown error')}")
-                        results.append(f"   Code: {error.get('code', 'N/A')}")
-                        results.append(f"   Status: {error.get('valStatus', 'N/A')}")
-
-                if validation.get("clientValidationList"):
-                    for error in validation["clientValidationList"]:
-                        results.append(f"❌ Client Error: {error.get('message', 'Unknown error')}")
+                results.extend(_format_validation(validation))
 
                 # If deletion failed due to dependencies, provide guidance
                 if any("in use by" in error.get("message", "") for error in validation.get("serverValidationList", [])):
@@ -631,7 +895,7 @@ def delete_aws_s3_backup_configurations() -> str:
                     results.append("   • Use list_aws_s3_backup_configurations() to see current configurations")
 
         results.append("")
-        results.append("=" * 50)
+        results.append(SEPARATOR)
         results.append("✅ AWS S3 backup configuration deletion operation completed")
 
         return "\n".join(results)
@@ -666,7 +930,7 @@ def remove_AWS_S3_backup_configuration(aws_acct_name: str) -> str:
 
         # First, get the existing S3 configurations
         try:
-            existing_response = dsa_client._make_request(
+            existing_response = get_dsa_client()._make_request(
                 method="GET", endpoint="dsa/components/backup-applications/aws-s3"
             )
 
@@ -674,8 +938,8 @@ def remove_AWS_S3_backup_configuration(aws_acct_name: str) -> str:
             if existing_response.get("status") == "LIST_AWS_APP_SUCCESSFUL":
                 # Use the exact same logic as the list function
                 aws_list = existing_response.get("aws", [])
-                logger.debug(f"bar: AWS list from API: {aws_list}")
-                logger.debug(f"bar: AWS list type: {type(aws_list)}, length: {len(aws_list) if aws_list else 0}")
+                logger.debug("bar: AWS list from API: %s", aws_list)
+                logger.debug("bar: AWS list type: %s, length: %d", type(aws_list), len(aws_list) if aws_list else 0)
                 if aws_list and isinstance(aws_list, list):
                     # For consistency with list function, treat each aws entry as a configuration
                     existing_s3_configurations = aws_list
@@ -684,7 +948,7 @@ def remove_AWS_S3_backup_configuration(aws_acct_name: str) -> str:
                     logger.warning(f"bar: No aws list found or wrong type. aws_list: {aws_list}")
             else:
                 logger.warning("bar: No existing S3 configurations found or unable to retrieve them")
-                logger.debug(f"bar: API response status: {existing_response.get('status')}")
+                logger.debug("bar: API response status: %s", existing_response.get("status"))
                 return f"❌ Could not retrieve existing S3 configurations to remove '{aws_acct_name}'"
 
         except Exception as e:
@@ -701,7 +965,7 @@ def remove_AWS_S3_backup_configuration(aws_acct_name: str) -> str:
             current_acct_name = config_aws_rest.get("acctName", "")
 
             logger.debug(
-                f"bar: Checking S3 config - current_acct_name: '{current_acct_name}', target: '{aws_acct_name}'"
+                "bar: Checking S3 config - current_acct_name: '%s', target: '%s'", current_acct_name, aws_acct_name
             )
             if current_acct_name == aws_acct_name:
                 s3config_exists = True
@@ -743,7 +1007,7 @@ def remove_AWS_S3_backup_configuration(aws_acct_name: str) -> str:
                         debug_info.append(f"   {key}: {value}")
             results = []
             results.append("🗂️ DSA S3 Configuration Removal")
-            results.append("=" * 50)
+            results.append(SEPARATOR)
             results.append(f"❌ S3 configuration '{aws_acct_name}' not found")
             results.append("")
             results.append("📋 Available S3 configurations:")
@@ -757,7 +1021,7 @@ def remove_AWS_S3_backup_configuration(aws_acct_name: str) -> str:
             for debug in debug_info:
                 results.append(f"   {debug}")
             results.append("")
-            results.append("=" * 50)
+            results.append(SEPARATOR)
             return "\n".join(results)
 
         logger.info(f"bar: Removing '{aws_acct_name}', keeping {len(s3_configurations_to_keep)} S3 configurations")
@@ -768,13 +1032,13 @@ def remove_AWS_S3_backup_configuration(aws_acct_name: str) -> str:
         # If no configurations remain, we need to delete all instead of posting empty config
         # if not s3_configurations_to_keep:
         #    logger.info("bar: No S3 configurations remaining, deleting all S3 configurations")
-        #    response = dsa_client._make_request(
+        #    response = get_dsa_client()._make_request(
         #        method="DELETE",
         #        endpoint="dsa/components/backup-applications/aws-s3"
         #    )
         # else:
         #    logger.info(f"bar: Reconfiguring with {len(s3_configurations_to_keep)} remaining S3 configurations")
-        #    response = dsa_client._make_request(
+        #    response = get_dsa_client()._make_request(
         #       method="POST",
         #        endpoint="dsa/components/backup-applications/aws-s3",
         #        data=request_data
@@ -782,15 +1046,15 @@ def remove_AWS_S3_backup_configuration(aws_acct_name: str) -> str:
 
         # Build the request data and delete the specific configuration that is already found to be existing
         # Use the correct endpoint with account name and trailing slash (matching successful Swagger call)
-        response = dsa_client._make_request(
+        response = get_dsa_client()._make_request(
             method="DELETE", endpoint=f"dsa/components/backup-applications/aws-s3/{aws_acct_name}/"
         )
 
-        logger.debug(f"bar: DSA API response: {response}")
+        logger.debug("bar: DSA API response: %s", response)
 
         results = []
         results.append("🗂️ DSA S3 Configuration Removal")
-        results.append("=" * 50)
+        results.append(SEPARATOR)
         results.append(f"📁 Removed S3 Configuration: {aws_acct_name}")
         results.append(f"📊 Remaining S3 Configurations: {len(s3_configurations_to_keep)}")
         results.append("")
@@ -820,21 +1084,10 @@ def remove_AWS_S3_backup_configuration(aws_acct_name: str) -> str:
             # Show validation errors if any
             if response.get("validationlist"):
                 validation = response["validationlist"]
-                results.append("")
-                results.append("🔍 Validation Details:")
-
-                if validation.get("serverValidationList"):
-                    for error in validation["serverValidationList"]:
-                        results.append(f"❌ Server Error: {error.get('message', 'Unknown error')}")
-                        results.append(f"   Code: {error.get('code', 'N/A')}")
-                        results.append(f"   Status: {error.get('valStatus', 'N/A')}")
-
-                if validation.get("clientValidationList"):
-                    for error in validation["clientValidationList"]:
-                        results.append(f"❌ Client Error: {error.get('message', 'Unknown error')}")
+                results.extend(_format_validation(validation))
 
         results.append("")
-        results.append("=" * 50)
+        results.append(SEPARATOR)
         results.append("✅ AWS S3 backup configuration removal operation completed")
 
         return "\n".join(results)
@@ -956,7 +1209,7 @@ def manage_AWS_S3_backup_configurations(  # noqa: PLR0917
             debug_info = f"DEBUG INFO:\n{debug_msg}\nFormatted structure: {formatted_buckets_by_region}\nFull request data: {request_data}"
 
             try:
-                response = dsa_client._make_request(
+                response = get_dsa_client()._make_request(
                     method="POST", endpoint="dsa/components/backup-applications/aws-s3", data=request_data
                 )
                 return f"✅ AWS backup solution configuration operation completed\nResponse: {response}\n\n{debug_info}"
@@ -1051,7 +1304,7 @@ def _list_media_servers() -> str:
     """List all media servers from the DSA system"""
     try:
         # Make request to list media servers
-        response = dsa_client._make_request("GET", "dsa/components/mediaservers")
+        response = get_dsa_client()._make_request("GET", "dsa/components/mediaservers")
 
         if not response.get("valid", False):
             error_messages = []
@@ -1081,7 +1334,7 @@ def _get_media_server(server_name: str) -> str:
     try:
         # Make request to get specific media server
         endpoint = f"dsa/components/mediaservers/{server_name}"
-        response = dsa_client._make_request("GET", endpoint)
+        response = get_dsa_client()._make_request("GET", endpoint)
 
         if not response.get("valid", False):
             error_messages = []
@@ -1128,7 +1381,7 @@ def _add_media_server(server_name: str, port: int, ip_list: list[dict[str, str]]
         payload = {"serverName": server_name.strip(), "port": port, "ipInfo": ip_list}
 
         # Make request to add media server
-        response = dsa_client._make_request(
+        response = get_dsa_client()._make_request(
             "POST",
             "dsa/components/mediaservers",
             data=payload,
@@ -1168,7 +1421,7 @@ def _delete_media_server(server_name: str, virtual: bool = False) -> str:
 
         # Make request to delete media server
         endpoint = f"dsa/components/mediaservers/{server_name}"
-        response = dsa_client._make_request("DELETE", endpoint, params=params)
+        response = get_dsa_client()._make_request("DELETE", endpoint, params=params)
 
         if not response.get("valid", False):
             error_messages = []
@@ -1197,7 +1450,7 @@ def _list_media_server_consumers() -> str:
     """List all media server consumers from the DSA system"""
     try:
         # Make request to list media server consumers
-        response = dsa_client._make_request("GET", "dsa/components/mediaservers/listconsumers")
+        response = get_dsa_client()._make_request("GET", "dsa/components/mediaservers/listconsumers")
 
         if not response.get("valid", False):
             error_messages = []
@@ -1227,7 +1480,7 @@ def _list_media_server_consumers_by_name(server_name: str) -> str:
     try:
         # Make request to list consumers for specific media server
         endpoint = f"dsa/components/mediaservers/listconsumers/{server_name.strip()}"
-        response = dsa_client._make_request("GET", endpoint)
+        response = get_dsa_client()._make_request("GET", endpoint)
 
         if not response.get("valid", False):
             error_messages = []
@@ -1328,7 +1581,7 @@ def _list_teradata_systems() -> str:
     """List all configured Teradata database systems in DSA"""
     try:
         # Make API call to list Teradata systems
-        response = dsa_client._make_request(method="GET", endpoint="dsa/components/systems/teradata")
+        response = get_dsa_client()._make_request(method="GET", endpoint="dsa/components/systems/teradata")
 
         # Return the full response for complete transparency
         return json.dumps(response, indent=2)
@@ -1347,7 +1600,10 @@ def _get_teradata_system(system_name: str) -> str:
         system_name = system_name.strip()
 
         # Make API call to get specific Teradata system
-        response = dsa_client._make_request(method="GET", endpoint=f"dsa/components/systems/teradata/{system_name}")
+        response = get_dsa_client()._make_request(
+            method="GET",
+            endpoint=f"dsa/components/systems/teradata/{system_name}",
+        )
 
         # Return the full response for complete transparency
         return json.dumps(response, indent=2)
@@ -1382,7 +1638,11 @@ def _config_teradata_system(
         }
 
         # Make API call to configure Teradata system
-        response = dsa_client._make_request(method="POST", endpoint="dsa/components/systems/teradata", data=config_data)
+        response = get_dsa_client()._make_request(
+            method="POST",
+            endpoint="dsa/components/systems/teradata",
+            data=config_data,
+        )
 
         # Return the full response for complete transparency
         return json.dumps(response, indent=2)
@@ -1401,7 +1661,7 @@ def _enable_teradata_system(system_name: str) -> str:
         system_name = system_name.strip()
 
         # Make API call to enable Teradata system
-        response = dsa_client._make_request(
+        response = get_dsa_client()._make_request(
             method="PATCH", endpoint=f"dsa/components/systems/enabling/{system_name}/", data={"enabled": True}
         )
 
@@ -1422,7 +1682,10 @@ def _delete_teradata_system(system_name: str) -> str:
         system_name = system_name.strip()
 
         # Make API call to delete Teradata system
-        response = dsa_client._make_request(method="DELETE", endpoint=f"dsa/components/systems/teradata/{system_name}")
+        response = get_dsa_client()._make_request(
+            method="DELETE",
+            endpoint=f"dsa/components/systems/teradata/{system_name}",
+        )
 
         # Return the full response for complete transparency
         return json.dumps(response, indent=2)
@@ -1436,7 +1699,7 @@ def _list_system_consumers() -> str:
     """List all system consumers in DSA"""
     try:
         # Make API call to list system consumers
-        response = dsa_client._make_request(method="GET", endpoint="dsa/components/systems/listconsumers")
+        response = get_dsa_client()._make_request(method="GET", endpoint="dsa/components/systems/listconsumers")
 
         # Return the full response for complete transparency
         return json.dumps(response, indent=2)
@@ -1455,7 +1718,7 @@ def _get_system_consumer(component_name: str) -> str:
         component_name = component_name.strip()
 
         # Make API call to get specific system consumer
-        response = dsa_client._make_request(
+        response = get_dsa_client()._make_request(
             method="GET", endpoint=f"dsa/components/systems/listconsumers/{component_name}"
         )
 
@@ -1473,7 +1736,7 @@ def _get_system_consumer(component_name: str) -> str:
 def _list_disk_file_target_groups(replication: bool = False) -> str:
     """List all disk file target groups"""
     try:
-        response = dsa_client._make_request(
+        response = get_dsa_client()._make_request(
             method="GET",
             endpoint=f"dsa/components/target-groups/disk-file-system?replication={str(replication).lower()}",
         )
@@ -1486,7 +1749,7 @@ def _list_disk_file_target_groups(replication: bool = False) -> str:
 def _get_disk_file_target_group(target_group_name: str, replication: bool = False) -> str:
     """Get details of a specific disk file target group"""
     try:
-        response = dsa_client._make_request(
+        response = get_dsa_client()._make_request(
             method="GET",
             endpoint=f"dsa/components/target-groups/disk-file-system/{target_group_name}/?replication={str(replication).lower()}",
         )
@@ -1509,7 +1772,7 @@ def _create_disk_file_target_group(target_group_config: str, replication: bool =
 
         logger.info(f"bar: Creating target disk file system '{target_group_name}' via DSA API")
 
-        response = dsa_client._make_request(
+        response = get_dsa_client()._make_request(
             method="POST",
             endpoint=f"dsa/components/target-groups/disk-file-system?replication={str(replication).lower()}",
             data=config_data,
@@ -1523,7 +1786,7 @@ def _create_disk_file_target_group(target_group_config: str, replication: bool =
 def _enable_disk_file_target_group(target_group_name: str) -> str:
     """Enable a disk file target group"""
     try:
-        response = dsa_client._make_request(
+        response = get_dsa_client()._make_request(
             method="PATCH", endpoint=f"dsa/components/target-groups/disk-file-system/enabling/{target_group_name}/"
         )
         return json.dumps(response, indent=2)
@@ -1535,7 +1798,7 @@ def _enable_disk_file_target_group(target_group_name: str) -> str:
 def _disable_disk_file_target_group(target_group_name: str) -> str:
     """Disable a disk file target group"""
     try:
-        response = dsa_client._make_request(
+        response = get_dsa_client()._make_request(
             method="PATCH", endpoint=f"dsa/components/target-groups/disk-file-system/disabling/{target_group_name}/"
         )
         return json.dumps(response, indent=2)
@@ -1549,7 +1812,7 @@ def _delete_disk_file_target_group(
 ) -> str:
     """Delete a disk file target group"""
     try:
-        response = dsa_client._make_request(
+        response = get_dsa_client()._make_request(
             method="DELETE",
             endpoint=f"dsa/components/target-groups/disk-file-system/{target_group_name}/?replication={str(replication).lower()}&deleteAllData={str(delete_all_data).lower()}",
         )
@@ -1658,7 +1921,7 @@ def _list_jobs(
             "status": status,
         }
 
-        response = dsa_client._make_request("GET", "dsa/jobs", params=params)
+        response = get_dsa_client()._make_request("GET", "dsa/jobs", params=params)
         return json.dumps(response, indent=2)
 
     except Exception as e:
@@ -1669,7 +1932,7 @@ def _list_jobs(
 def _get_job(job_name: str) -> str:
     """Get job definition by name"""
     try:
-        response = dsa_client._make_request(method="GET", endpoint=f"dsa/jobs/{job_name}")
+        response = get_dsa_client()._make_request(method="GET", endpoint=f"dsa/jobs/{job_name}")
         return json.dumps(response, indent=2)
 
     except Exception as e:
@@ -1680,7 +1943,7 @@ def _get_job(job_name: str) -> str:
 def _create_job(job_config: dict) -> str:
     """Create a new job"""
     try:
-        response = dsa_client._make_request(method="POST", endpoint="dsa/jobs", data=job_config)
+        response = get_dsa_client()._make_request(method="POST", endpoint="dsa/jobs", data=job_config)
         return json.dumps(response, indent=2)
 
     except Exception as e:
@@ -1691,7 +1954,7 @@ def _create_job(job_config: dict) -> str:
 def _update_job(job_config: dict) -> str:
     """Update an existing job"""
     try:
-        response = dsa_client._make_request(method="PUT", endpoint="dsa/jobs", data=job_config)
+        response = get_dsa_client()._make_request(method="PUT", endpoint="dsa/jobs", data=job_config)
         return json.dumps(response, indent=2)
 
     except Exception as e:
@@ -1702,7 +1965,7 @@ def _update_job(job_config: dict) -> str:
 def _run_job(job_config: dict) -> str:
     """Run/execute a job"""
     try:
-        response = dsa_client._make_request(method="POST", endpoint="dsa/jobs/running", data=job_config)
+        response = get_dsa_client()._make_request(method="POST", endpoint="dsa/jobs/running", data=job_config)
         return json.dumps(response, indent=2)
 
     except Exception as e:
@@ -1713,7 +1976,7 @@ def _run_job(job_config: dict) -> str:
 def _get_job_status(job_name: str) -> str:
     """Get job status"""
     try:
-        response = dsa_client._make_request(method="GET", endpoint=f"dsa/jobs/{job_name}/status")
+        response = get_dsa_client()._make_request(method="GET", endpoint=f"dsa/jobs/{job_name}/status")
         return json.dumps(response, indent=2)
 
     except Exception as e:
@@ -1724,7 +1987,7 @@ def _get_job_status(job_name: str) -> str:
 def _retire_job(job_name: str, retired: bool = True) -> str:
     """Retire or unretire a job"""
     try:
-        response = dsa_client._make_request(
+        response = get_dsa_client()._make_request(
             method="PATCH", endpoint=f"dsa/jobs/{job_name}?retired={str(retired).lower()}"
         )
         return json.dumps(response, indent=2)
@@ -1738,7 +2001,7 @@ def _retire_job(job_name: str, retired: bool = True) -> str:
 def _delete_job(job_name: str) -> str:
     """Delete a job"""
     try:
-        response = dsa_client._make_request(method="DELETE", endpoint=f"dsa/jobs/{job_name}")
+        response = get_dsa_client()._make_request(method="DELETE", endpoint=f"dsa/jobs/{job_name}")
         return json.dumps(response, indent=2)
 
     except Exception as e:
@@ -1832,11 +2095,14 @@ def manage_job_operations(operation: str, job_name: str | None = None, job_confi
 # ------------------ Tool Handler for MCP ------------------#
 
 
-def handle_bar_manageDsaDiskFileSystem(
+def handle_bar_manageDsaDiskFileSystem(  # noqa: PLR0917
     conn: Any,  # Not used for DSA operations, but required by MCP framework
     operation: str,
     file_system_path: str | None = None,
     max_files: int | None = None,
+    file_systems: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
     *args,
     **kwargs,
 ):
@@ -1848,9 +2114,15 @@ def handle_bar_manageDsaDiskFileSystem(
 
     Args:
         conn: Database connection (not used for DSA operations)
-        operation: The operation to perform (list, config, delete_all, remove)
+        operation: The operation to perform (list, config, delete_all, remove, batch_config, batch_remove)
         file_system_path: Path to the file system (for config and remove operations)
         max_files: Maximum number of files allowed (for config operation)
+        file_systems: JSON list for batch operations, applied with a single DSA update:
+                      batch_config - '[{"fileSystemPath": "/backup/a", "maxFiles": 100}, ...]'
+                      batch_remove - '["/backup/a", "/backup/b"]'
+        limit: Maximum number of file systems to return (for list operation, default: all)
+        offset: Index of the first file system to return (for list operation); pass the
+                next_offset from the previous response metadata to fetch the next page
 
     **Note: To UPDATE an existing disk file system configuration, simply use the 'config'
     operation with the same file_system_path. The DSA API will automatically override the
@@ -1860,14 +2132,22 @@ def handle_bar_manageDsaDiskFileSystem(
         ResponseType: formatted response with operation results + metadata
     """
     logger.debug(
-        f"bar: Tool: handle_bar_manageDsaDiskFileSystem: Args: operation: {operation}, file_system_path: {file_system_path}, max_files: {max_files}"
+        "bar: Tool: handle_bar_manageDsaDiskFileSystem: Args: operation: %s, file_system_path: %s, max_files: %s",
+        operation,
+        file_system_path,
+        max_files,
     )
 
     try:
         # Run the synchronous operation
-        result = manage_dsa_disk_file_systems(
-            operation=operation, file_system_path=file_system_path, max_files=max_files
-        )
+        next_offset = None
+        if operation == "list":
+            # Listed directly so the paging cursor can be returned in the metadata
+            result, next_offset = _list_disk_file_systems_page(limit=limit, offset=offset)
+        else:
+            result = manage_dsa_disk_file_systems(
+                operation=operation, file_system_path=file_system_path, max_files=max_files, file_systems=file_systems
+            )
 
         metadata = {
             "tool_name": "bar_manageDsaDiskFileSystem",
@@ -1876,8 +2156,10 @@ def handle_bar_manageDsaDiskFileSystem(
             "max_files": max_files,
             "success": True,
         }
+        if operation == "list" and (limit is not None or offset):
+            metadata.update({"limit": limit, "offset": offset, "next_offset": next_offset})
 
-        logger.debug(f"bar: Tool: handle_bar_manageDsaDiskFileSystem: metadata: {metadata}")
+        logger.debug("bar: Tool: handle_bar_manageDsaDiskFileSystem: metadata: %s", metadata)
         return create_response(result, metadata)
 
     except Exception as e:
@@ -1936,9 +2218,15 @@ def handle_bar_manageAWSS3Operations(  # noqa: PLR0917
         acctName,
     )
     logger.debug(
-        f"bar: Tool: handle_bar_manageAWSS3Operations: Args: operation: {operation}, accessId: {accessId}, accessKey: {accessKey}, bucketsByRegion: {bucketsByRegion}, acctName: {acctName}"
+        "bar: Tool: handle_bar_manageAWSS3Operations: Args: operation: %s, accessId: %s, accessKey: %s, "
+        "bucketsByRegion: %s, acctName: %s",
+        operation,
+        accessId,
+        accessKey,
+        bucketsByRegion,
+        acctName,
     )
-    logger.debug(f"bar: bucketsByRegion type: {type(bucketsByRegion)} value: {bucketsByRegion}")
+    logger.debug("bar: bucketsByRegion type: %s value: %s", type(bucketsByRegion), bucketsByRegion)
     try:
         # Run the synchronous operation
         result = manage_AWS_S3_backup_configurations(
@@ -1963,7 +2251,7 @@ def handle_bar_manageAWSS3Operations(  # noqa: PLR0917
             "acctName": acctName,
             "success": True,
         }
-        logger.debug(f"bar: Tool: handle_bar_manageAWSS3Operations: metadata: {metadata}")
+        logger.debug("bar: Tool: handle_bar_manageAWSS3Operations: metadata: %s", metadata)
         return create_response(result, metadata)
     except Exception as e:
         logger.error(f"bar: Error in handle_bar_manageAWSS3Operations: {e}")
@@ -2012,7 +2300,10 @@ def handle_bar_manageMediaServer(  # noqa: PLR0917
         ResponseType: formatted response with media server operation results + metadata
     """
     logger.debug(
-        f"bar: Tool: handle_bar_manageMediaServer: Args: operation: {operation}, server_name: {server_name}, port: {port}"
+        "bar: Tool: handle_bar_manageMediaServer: Args: operation: %s, server_name: %s, port: %s",
+        operation,
+        server_name,
+        port,
     )
 
     try:
@@ -2045,7 +2336,7 @@ def handle_bar_manageMediaServer(  # noqa: PLR0917
             "server_name": server_name,
             "success": True,
         }
-        logger.debug(f"bar: Tool: handle_bar_manageMediaServer: metadata: {metadata}")
+        logger.debug("bar: Tool: handle_bar_manageMediaServer: metadata: %s", metadata)
         return create_response(result, metadata)
     except Exception as e:
         logger.error(f"bar: Error in handle_bar_manageMediaServer: {e}")
@@ -2096,7 +2387,7 @@ def handle_bar_manageTeradataSystem(  # noqa: PLR0917
     """
     try:
         logger.debug(
-            f"bar: Tool: handle_bar_manageTeradataSystem: Args: operation: {operation}, system_name: {system_name}"
+            "bar: Tool: handle_bar_manageTeradataSystem: Args: operation: %s, system_name: %s", operation, system_name
         )
 
         # Validate operation
@@ -2141,7 +2432,7 @@ def handle_bar_manageTeradataSystem(  # noqa: PLR0917
         if component_name:
             metadata["component_name"] = component_name
 
-        logger.debug(f"bar: Tool: handle_bar_manageTeradataSystem: metadata: {metadata}")
+        logger.debug("bar: Tool: handle_bar_manageTeradataSystem: metadata: %s", metadata)
         return create_response(result, metadata)
 
     except Exception as e:
@@ -2251,7 +2542,7 @@ def handle_bar_manageDiskFileTargetGroup(  # noqa: PLR0917
         if delete_all_data:
             metadata["delete_all_data"] = delete_all_data
 
-        logger.debug(f"bar: Tool: handle_bar_manageDiskFileTargetGroup: metadata: {metadata}")
+        logger.debug("bar: Tool: handle_bar_manageDiskFileTargetGroup: metadata: %s", metadata)
         return create_response(result, metadata)
 
     except Exception as e:
@@ -2707,7 +2998,7 @@ def handle_bar_manageJob(
         8. Suggest using status operation to monitor job progress after running
     """
     try:
-        logger.debug(f"bar: Tool: bar_manageJob: Args: operation: {operation}, job_name: {job_name}")
+        logger.debug("bar: Tool: bar_manageJob: Args: operation: %s, job_name: %s", operation, job_name)
 
         # Validate operation
         valid_operations = ["list", "get", "create", "update", "run", "status", "retire", "unretire", "delete"]
@@ -2730,7 +3021,7 @@ def handle_bar_manageJob(
         if job_config:
             metadata["job_config"] = job_config
 
-        logger.debug(f"bar: Tool: bar_manageJob: metadata: {metadata}")
+        logger.debug("bar: Tool: bar_manageJob: metadata: %s", metadata)
         return create_response(result, metadata)
 
     except Exception as e:
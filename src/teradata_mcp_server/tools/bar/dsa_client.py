@@ -1,18 +1,78 @@
 """DSA REST API client for BAR operations"""
 
+import copy
 import json
 import logging
 import os
-from typing import Any
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
 from urllib.parse import urljoin
 
 import requests  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+from urllib3.util.retry import Retry
+
+try:
+    # orjson parses large DSA listings noticeably faster; fall back to the stdlib when absent
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger("teradata_mcp_server")
 
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+RETURN_204 = 204
+RETURN_304 = 304
 RETURN_400 = 400
 RETURN_401 = 401
 
+# HTTP connection pooling for the DSA REST API; the pool is shared by every DSAClient,
+# and POOL_MAXSIZE leaves headroom over the default DSA_MAX_CONCURRENCY bulkhead
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+RETRY_TOTAL = 3
+RETRY_CONNECT = 3
+RETRY_READ = 2
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_BACKOFF_JITTER = 0.1
+RETRY_STATUS_FORCELIST = (502, 503, 504)
+RETRY_ALLOWED_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})  # idempotent only, never POST
+
+HEALTH_CHECK_ENDPOINT = "dsa/components/backup-applications/disk-file-system"
+
+# Short-lived LRU cache for configuration GETs (job status and the like are never cached)
+GET_CACHE_PREFIX = "dsa/components/"
+GET_CACHE_MAXSIZE = 128
+
+# Circuit breaker: after CIRCUIT_FAILURE_THRESHOLD consecutive connection failures or 5xx
+# responses, calls fail fast until the reset window (doubling per consecutive trip) has passed
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_SECONDS = 30.0
+CIRCUIT_MAX_RESET_SECONDS = 60.0
+RETURN_500 = 500
+
+
+_Number = TypeVar("_Number", int, float)
+
+
+def _env_number(name: str, default: _Number) -> _Number:
+    """Read a numeric environment variable of the same type as default, failing fast on a bad value"""
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return type(default)(raw)
+    except ValueError:
+        kind = "an integer" if isinstance(default, int) else "a number"
+        raise SystemExit(f"Invalid value for {name}: {raw!r} (expected {kind})") from None
+
 
 class DSAClientError(Exception):
     """Base exception for DSA client errors"""
@@ -30,6 +90,50 @@ class DSAAPIError(DSAClientError):
     """API error from DSA system"""
 
 
+class DSACircuitOpenError(DSAConnectionError):
+    """DSA calls are short-circuited after repeated failures"""
+
+
+class _NotModifiedError(DSAAPIError):
+    """A 304 reply arrived but the body it validates is no longer held (e.g. a write cleared the cache)"""
+
+
+class _JitteredRetry(Retry):
+    """urllib3 Retry with random jitter added to the exponential backoff"""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, RETRY_BACKOFF_JITTER) if backoff > 0 else backoff
+
+
+# Connection pools are shared by every DSAClient in the process, keyed by verify_ssl
+_ADAPTERS: dict[bool, HTTPAdapter] = {}
+_ADAPTERS_LOCK = threading.Lock()
+
+
+def _get_adapter(verify_ssl: bool) -> HTTPAdapter:
+    """Return the process-wide HTTPAdapter (pool + retry policy) for this TLS verification mode"""
+    with _ADAPTERS_LOCK:
+        adapter = _ADAPTERS.get(verify_ssl)
+        if adapter is None:
+            # Retries (with jittered backoff) only apply to idempotent methods, never to POST.
+            adapter = _ADAPTERS[verify_ssl] = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=_JitteredRetry(
+                    total=RETRY_TOTAL,
+                    connect=RETRY_CONNECT,
+                    read=RETRY_READ,
+                    backoff_factor=RETRY_BACKOFF_FACTOR,
+                    status_forcelist=RETRY_STATUS_FORCELIST,
+                    allowed_methods=RETRY_ALLOWED_METHODS,
+                    respect_retry_after_header=True,
+                    raise_on_status=False,  # hand the final 5xx back so it is reported as DSAAPIError
+                ),
+            )
+        return adapter
+
+
 class DSAClient:
     """Client for interacting with Teradata DSA REST API"""
 
@@ -69,13 +173,54 @@ class DSAClient:
         self.verify_ssl = (
             verify_ssl
             if verify_ssl is not None
-            else os.getenv("DSA_VERIFY_SSL", "true").lower() in ["true", "1", "yes"]
+            else os.getenv("DSA_VERIFY_SSL", "true").strip().lower() in _TRUE_VALUES
         )
         self.timeout = timeout or float(os.getenv("DSA_CONNECTION_TIMEOUT", "30"))
-
-        # Ensure base URL ends with /
-        if not self.base_url.endswith("/"):
-            self.base_url += "/"
+        # Short-lived cache for component GET responses, keyed by (endpoint, params); cleared on any write
+        self.get_cache_ttl = _env_number("DSA_GET_CACHE_TTL", 5.0)
+        self._get_cache: OrderedDict[tuple, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._get_cache_lock = threading.Lock()
+        # ETag validators for cached GETs: once the TTL lapses, a 304 reply reuses the stored body
+        self._etags: OrderedDict[tuple, tuple[str, dict[str, Any]]] = OrderedDict()
+        # Circuit breaker state ("closed" | "open" | "half_open")
+        self._cb_state = "closed"
+        self._cb_failures = 0
+        self._cb_trips = 0
+        self._cb_opened_at = 0.0
+        self._cb_reset_seconds = CIRCUIT_RESET_SECONDS
+        self._cb_trial_started: float | None = None  # set while the single half-open trial call runs
+        self._cb_lock = threading.Lock()
+        # Concurrent identical GETs are coalesced onto one HTTP call
+        self._inflight: dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # Bulkhead: submit() runs calls on a pool of DSA_MAX_CONCURRENCY threads, at most
+        # DSA_ENDPOINT_MAX of them per endpoint group, so one slow endpoint cannot tie up every worker
+        self.max_concurrency = _env_number("DSA_MAX_CONCURRENCY", 8)
+        self.endpoint_max = _env_number("DSA_ENDPOINT_MAX", 4)
+        self._endpoint_semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._endpoint_semaphores_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Ensure base URL ends with exactly one /
+        self.base_url = self.base_url.rstrip("/") + "/"
+
+        # Persistent session so every call reuses pooled keep-alive (TLS) connections,
+        # shared with any other DSAClient in the process through the common adapter.
+        self._session = requests.Session()
+        adapter = _get_adapter(self.verify_ssl)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.auth = self._get_auth()
+        self._session.verify = self.verify_ssl
+        self._session.headers.update(
+            {
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "User-Agent": "Teradata-MCP-Server-BAR/1.0.0",
+                "Connection": "keep-alive",
+                "Accept-Encoding": "gzip, deflate",
+            }
+        )
 
         logger.info(f"bar: Initialized DSA client for {self.base_url}")
 
@@ -85,6 +230,175 @@ class DSAClient:
             return (self.username, self.password)
         return None
 
+    @staticmethod
+    def _cache_key(endpoint: str, params: dict[str, Any] | None) -> tuple:
+        return (endpoint, tuple(sorted(params.items())) if params else ())
+
+    def _cache_get(self, key: tuple) -> dict[str, Any] | None:
+        with self._get_cache_lock:
+            cached = self._get_cache.get(key)
+            if cached is None:
+                return None
+            if time.monotonic() - cached[0] >= self.get_cache_ttl:
+                del self._get_cache[key]
+                return None
+            self._get_cache.move_to_end(key)
+            return copy.deepcopy(cached[1])
+
+    def _cache_set(self, key: tuple, response: dict[str, Any], etag: str | None = None) -> None:
+        """Store a private copy of response; hits hand out copies, so callers may mutate what they get"""
+        if self.get_cache_ttl <= 0:
+            return
+        response = copy.deepcopy(response)
+        with self._get_cache_lock:
+            self._get_cache[key] = (time.monotonic(), response)
+            self._get_cache.move_to_end(key)
+            while len(self._get_cache) > GET_CACHE_MAXSIZE:
+                self._get_cache.popitem(last=False)
+            # A body stored without its ETag must not be revalidated against an older one
+            if etag:
+                self._etags[key] = (etag, response)
+                self._etags.move_to_end(key)
+                while len(self._etags) > GET_CACHE_MAXSIZE:
+                    self._etags.popitem(last=False)
+            else:
+                self._etags.pop(key, None)
+
+    def _conditional_headers(self, cache_key: tuple | None, headers: dict[str, str] | None) -> dict[str, str] | None:
+        """Add If-None-Match to a cacheable GET whose last response carried an ETag"""
+        if cache_key is None:
+            return headers
+        with self._get_cache_lock:
+            validator = self._etags.get(cache_key)
+        if validator is None:
+            return headers
+        return {**(headers or {}), "If-None-Match": validator[0]}
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached GET responses"""
+        with self._get_cache_lock:
+            self._get_cache.clear()
+            self._etags.clear()
+
+    def _check_circuit(self) -> None:
+        """Raise DSACircuitOpenError while the circuit is open; let one trial call through once it may reset
+
+        While the trial runs, other callers are rejected. A trial that never reports back (an
+        exception outside the HTTP call) stops blocking others after the request timeout.
+        """
+        with self._cb_lock:
+            if self._cb_state == "closed":
+                return
+            now = time.monotonic()
+            if self._cb_state == "half_open":
+                if self._cb_trial_started is not None and now - self._cb_trial_started < self.timeout:
+                    raise DSACircuitOpenError("bar: DSA circuit half-open, a trial request is already in flight")
+                self._cb_trial_started = now
+                return
+            remaining = self._cb_reset_seconds - (now - self._cb_opened_at)
+            if remaining > 0:
+                raise DSACircuitOpenError(
+                    f"bar: DSA circuit open after {self._cb_failures} consecutive failures, "
+                    f"retrying in {remaining:.0f}s"
+                )
+            self._cb_state = "half_open"
+            self._cb_trial_started = now
+            logger.info("bar: DSA circuit half-open, allowing a trial request")
+
+    def _record_success(self) -> None:
+        with self._cb_lock:
+            if self._cb_state != "closed":
+                logger.info("bar: DSA circuit closed")
+            self._cb_state = "closed"
+            self._cb_failures = 0
+            self._cb_trips = 0
+            self._cb_trial_started = None
+
+    def _record_failure(self) -> None:
+        with self._cb_lock:
+            self._cb_failures += 1
+            self._cb_trial_started = None
+            if self._cb_state == "half_open" or self._cb_failures >= CIRCUIT_FAILURE_THRESHOLD:
+                self._cb_state = "open"
+                self._cb_opened_at = time.monotonic()
+                self._cb_reset_seconds = min(CIRCUIT_MAX_RESET_SECONDS, CIRCUIT_RESET_SECONDS * 2**self._cb_trips)
+                self._cb_trips += 1
+                logger.warning(
+                    f"bar: DSA circuit opened after {self._cb_failures} consecutive failures "
+                    f"for {self._cb_reset_seconds:.0f}s"
+                )
+
+    def _begin_request(
+        self, method: str, endpoint: str, params: dict[str, Any] | None
+    ) -> tuple[tuple | None, dict[str, Any] | None]:
+        """Apply the GET cache and circuit breaker ahead of a request
+
+        A fresh cached GET is served even while the circuit is open; anything that
+        needs the network goes through the circuit check.
+
+        Returns (cache_key, cached_response); cache_key is None when the response must not be cached.
+        """
+        # Component configuration GETs are served from the short-lived cache. A write can
+        # change what other components report (e.g. consumers), so it clears the whole cache.
+        if method.upper() != "GET":
+            self._check_circuit()
+            self.invalidate_cache()
+            return None, None
+        if not endpoint.startswith(GET_CACHE_PREFIX) or self.get_cache_ttl <= 0:
+            self._check_circuit()
+            return None, None
+        cache_key = self._cache_key(endpoint, params)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("bar: Using cached GET response for %s", endpoint)
+            return cache_key, cached
+        self._check_circuit()
+        return cache_key, None
+
+    def _handle_response(self, response: requests.Response, cache_key: tuple | None) -> dict[str, Any]:
+        """Record the outcome for the circuit breaker, map errors and decode the JSON body
+
+        The body is decoded straight from the raw bytes; response.text (charset detection and
+        a full unicode decode) is only touched to report an error.
+        """
+        status_code = response.status_code
+        logger.debug("bar: Response status: %s", status_code)
+        if status_code >= RETURN_500:
+            self._record_failure()
+        else:
+            self._record_success()
+        # Handle authentication errors
+        if status_code == RETURN_401:
+            raise DSAAuthenticationError("Authentication failed - check username and password")
+        # Handle other client/server errors
+        if status_code >= RETURN_400:
+            error_msg = f"bar: DSA API error: {status_code} - {response.text}"
+            logger.error(error_msg)
+            raise DSAAPIError(error_msg)
+        # Conditional GET: the server confirmed the body we already hold is still current.
+        # A 304 has no body, so it must never fall through to the empty-body {} below.
+        if status_code == RETURN_304:
+            validator = None
+            if cache_key is not None:
+                with self._get_cache_lock:
+                    validator = self._etags.get(cache_key)
+            if validator is None:
+                raise _NotModifiedError("bar: DSA API answered 304 but no cached body is held for it")
+            self._cache_set(cache_key, validator[1], validator[0])
+            return copy.deepcopy(validator[1])
+        # Some POSTs answer 204 or an empty 2xx body; there is nothing to decode
+        if status_code == RETURN_204 or not response.content:
+            return {}
+        # Parse JSON response
+        try:
+            result: dict[str, Any] = _json_loads(response.content)
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.error(f"bar: Failed to parse JSON response: {e}")
+            raise DSAAPIError(f"Invalid JSON response from DSA API: {e}") from e
+        if cache_key is not None:
+            self._cache_set(cache_key, result, response.headers.get("ETag"))
+        return result
+
     def _make_request(
         self,
         method: str,
@@ -107,65 +421,158 @@ class DSAClient:
 
         Raises:
             DSAConnectionError: If connection fails
+            DSACircuitOpenError: If recent calls failed and the circuit breaker is open
             DSAAuthenticationError: If authentication fails
             DSAAPIError: If API returns an error
         """
         url = urljoin(self.base_url, endpoint)
-
-        # Prepare headers
-        request_headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "User-Agent": "Teradata-MCP-Server-BAR/1.0.0",
-        }
+        cache_key, cached = self._begin_request(method, endpoint, params)
+        if cached is not None:
+            return cached
+        if method.upper() != "GET":
+            try:
+                return self._send_request(method, url, params, data, headers, cache_key)
+            finally:
+                # A GET that raced the write may have cached the old state
+                self.invalidate_cache()
         if headers:
-            request_headers.update(headers)
+            return self._send_request(method, url, params, data, headers, cache_key)
+
+        # Identical GETs already in flight on another thread share that call's result
+        inflight_key = self._cache_key(endpoint, params)
+        with self._inflight_lock:
+            future = self._inflight.get(inflight_key)
+            is_owner = future is None
+            if future is None:
+                future = self._inflight[inflight_key] = Future()
+        if not is_owner:
+            logger.debug("bar: Joining in-flight GET request for %s", endpoint)
+            # No timeout of its own: the leader may still be retrying, and it always resolves the future.
+            # The leader's caller holds the same object, so the follower gets its own copy.
+            return copy.deepcopy(future.result())
 
-        # Prepare authentication
-        auth = self._get_auth()
-
-        logger.debug(f"bar: Making {method} request to {url} with params: {params}")
+        try:
+            result = self._send_request(method, url, params, data, headers, cache_key)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[inflight_key]
+            if not future.done():
+                # Interrupted by a BaseException (e.g. KeyboardInterrupt); release the followers
+                future.set_exception(DSAConnectionError(f"bar: In-flight DSA request to {url} was interrupted"))
+
+    def _send_request(  # noqa: PLR0917
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        cache_key: tuple | None,
+    ) -> dict[str, Any]:
+        """Send one request over the pooled session and handle the response"""
+        logger.debug("bar: Making %s request to %s with params: %s", method, url, params)
 
         try:
-            response = requests.request(
+            response = self._session.request(
                 method=method,
                 url=url,
                 params=params,
                 json=data,
-                headers=request_headers,
-                auth=auth,
-                verify=self.verify_ssl,
+                headers=self._conditional_headers(cache_key, headers),  # merged over the session defaults
                 timeout=self.timeout,
             )
-            logger.debug(f"bar: Response status: {response.status_code}")
-            # Handle authentication errors
-            if response.status_code == RETURN_401:
-                raise DSAAuthenticationError("Authentication failed - check username and password")
-            # Handle other client/server errors
-            if response.status_code >= RETURN_400:
-                error_msg = f"bar: DSA API error: {response.status_code} - {response.text}"
-                logger.error(error_msg)
-                raise DSAAPIError(error_msg)
-            # Parse JSON response
             try:
-                result: dict[str, Any] = response.json()
-                return result
-            except json.JSONDecodeError as e:
-                logger.error(f"bar: Failed to parse JSON response: {e}")
-                raise DSAAPIError(f"Invalid JSON response from DSA API: {e}") from e
+                return self._handle_response(response, cache_key)
+            except _NotModifiedError:
+                # The validator was dropped while the request was in flight; fetch the full body
+                response = self._session.request(
+                    method=method, url=url, params=params, json=data, headers=headers, timeout=self.timeout
+                )
+                return self._handle_response(response, cache_key)
         except requests.exceptions.ConnectionError as e:
             error_msg = f"bar: Failed to connect to DSA server at {url}: {e}"
             logger.error(error_msg)
+            self._record_failure()
             raise DSAConnectionError(error_msg) from e
         except requests.exceptions.Timeout as e:
             error_msg = f"bar: Request timeout connecting to DSA server: {e}"
             logger.error(error_msg)
+            self._record_failure()
             raise DSAConnectionError(error_msg) from e
         except requests.exceptions.RequestException as e:
             error_msg = f"bar: HTTP error communicating with DSA server: {e}"
             logger.error(error_msg)
+            self._record_failure()
             raise DSAConnectionError(error_msg) from e
 
+    @staticmethod
+    def _endpoint_group(endpoint: str) -> str:
+        """Endpoint template used as the bulkhead key: object names after the resource are dropped
+
+        e.g. dsa/jobs/<job>/status -> dsa/jobs, dsa/components/systems/teradata/<system> -> dsa/components/systems
+        """
+        segments = endpoint.strip("/").split("/")
+        depth = 3 if len(segments) > 1 and segments[1] == "components" else 2
+        return "/".join(segments[:depth])
+
+    def _bulkhead_request(self, method: str, endpoint: str, **kwargs: Any) -> dict[str, Any]:
+        """Run _make_request holding the endpoint group's semaphore"""
+        group = self._endpoint_group(endpoint)
+        with self._endpoint_semaphores_lock:
+            semaphore = self._endpoint_semaphores.get(group)
+            if semaphore is None:
+                semaphore = self._endpoint_semaphores[group] = threading.BoundedSemaphore(self.endpoint_max)
+        if not semaphore.acquire(timeout=self.timeout):
+            raise DSAConnectionError(
+                f"bar: Too many concurrent DSA requests to {group} (limit {self.endpoint_max}), "
+                f"gave up after {self.timeout}s"
+            )
+        try:
+            return self._make_request(method, endpoint, **kwargs)
+        finally:
+            semaphore.release()
+
+    def submit(self, method: str, endpoint: str, **kwargs: Any) -> Future:
+        """Run _make_request on the client's bounded worker pool, within the endpoint group's limit
+
+        Lets a caller issue several independent DSA calls at once and collect them with
+        concurrent.futures.as_completed or Future.result().
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (relative to base URL)
+            **kwargs: params, data and headers, as for _make_request
+
+        Returns:
+            Future resolving to the response dictionary
+        """
+        with self._endpoint_semaphores_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="dsa")
+            executor = self._executor
+        return executor.submit(self._bulkhead_request, method, endpoint, **kwargs)
+
+    def close(self) -> None:
+        """Close the session and the submit() worker pool"""
+        with self._endpoint_semaphores_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        # Unmount first: the adapter's pool is shared with other clients and must stay open
+        self._session.adapters.clear()
+        self._session.close()
+
+    def __enter__(self) -> "DSAClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def health_check(self) -> dict[str, Any]:
         """Perform a health check on the DSA system
 
@@ -174,7 +581,7 @@ class DSAClient:
         """
         try:
             # Try to make a simple API call to test connectivity
-            response = self._make_request("GET", "dsa/components/backup-applications/disk-file-system")
+            response = self._make_request("GET", HEALTH_CHECK_ENDPOINT)
 
             return {
                 "status": "healthy",
@@ -187,11 +594,33 @@ class DSAClient:
                 "error": "authentication_failed",
                 "message": "Authentication failed - check credentials",
             }
+        except DSACircuitOpenError as e:
+            return {"status": "unhealthy", "error": "circuit_open", "message": str(e)}
         except DSAConnectionError as e:
             return {"status": "unhealthy", "error": "connection_failed", "message": str(e)}
         except Exception as e:
             return {"status": "unhealthy", "error": "unknown_error", "message": str(e)}
 
 
-# Global DSA client instance
-dsa_client = DSAClient()
+# Shared DSA client, created on first use so importing the BAR tools does no setup work
+_dsa_client: DSAClient | None = None
+_dsa_client_lock = threading.Lock()
+
+
+def get_dsa_client() -> DSAClient:
+    """Return the shared DSA client, creating it on first call"""
+    global _dsa_client
+    if _dsa_client is None:
+        with _dsa_client_lock:
+            if _dsa_client is None:
+                _dsa_client = DSAClient()
+    return _dsa_client
+
+
+def reset_dsa_client() -> None:
+    """Close and drop the shared DSA client so the next call re-reads the environment"""
+    global _dsa_client
+    with _dsa_client_lock:
+        if _dsa_client is not None:
+            _dsa_client.close()
+        _dsa_client = None
@@ -698,13 +698,9 @@ def handle_base_columnMetadata(  # noqa: PLR0917
         # Patterns use SQL LIKE-style % wildcards, converted to fnmatch *.
         v_step_no = "015"
         if exclude_objects:
-            patterns = [p.strip().replace("%", "*") for p in exclude_objects.split(",") if p.strip()]
+            is_excluded = _compile_name_filter([p.strip().replace("%", "*") for p in exclude_objects.split(",")])
             pre_count = len(obj_infos)
-            obj_infos = [
-                info
-                for info in obj_infos
-                if not any(fnmatch.fnmatch(info["ObjectName"].upper(), pat.upper()) for pat in patterns)
-            ]
+            obj_infos = [info for info in obj_infos if not is_excluded(info["ObjectName"])]
             excluded_count = pre_count - len(obj_infos)
             logger.debug(
                 f"{C_MODULE}:{v_step_no} Excluded {excluded_count} object(s) "
@@ -1086,6 +1082,32 @@ def _columnsVX_fallback(
         ]
 
 
+def _compile_name_filter(patterns: list[str]) -> Callable[[str], bool]:
+    """
+    Build a case-insensitive matcher for a list of fnmatch-style name patterns.
+
+    Patterns without wildcards are checked with a set lookup; the rest are
+    translated once into a single regex, so each name costs at most one
+    match however many patterns were given.
+
+    Args:
+        patterns: fnmatch patterns (blank entries are ignored).
+
+    Returns:
+        Callable returning True when a name matches any pattern.
+    """
+    upper = [p.upper() for p in patterns if p]
+    exact = {p for p in upper if not any(c in p for c in "*?[")}
+    wildcard = [p for p in upper if p not in exact]
+    wildcard_re = re.compile("|".join(fnmatch.translate(p) for p in wildcard)) if wildcard else None
+
+    def matches(name: str) -> bool:
+        name = name.upper()
+        return name in exact or (wildcard_re is not None and wildcard_re.match(name) is not None)
+
+    return matches
+
+
 def _safe_int(value) -> int | None:
     """
     Safely convert a value to int, returning None on failure.
@@ -7,14 +7,77 @@ It allows:
  - searching for documentation snippets based on keywords.
 """
 
+import heapq
 import inspect
+import itertools
 import re
+import sys
+import threading
+from collections import OrderedDict, defaultdict
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
-
-@dataclass
+_SEARCH_CACHE_MAXSIZE = 128  # per cache; cleared whenever a tool or doc is registered
+
+# Parameters injected by the server rather than supplied by the caller
+_INTERNAL_PARAMS = frozenset({"conn", "tool_name", "fs_config", "args", "kwargs"})
+
+# Common words left out of the keyword index
+_STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "has",
+        "he",
+        "in",
+        "is",
+        "it",
+        "its",
+        "of",
+        "on",
+        "that",
+        "the",
+        "to",
+        "was",
+        "will",
+        "with",
+        "via",
+        "this",
+        "or",
+        "if",
+    }
+)
+_WORD_RE = re.compile(r"\b\w+\b")
+
+_ARGS_SECTION_HEADERS = frozenset({"arguments:", "args:", "parameters:", "params:"})
+# Matches "param_name - description" or "param_name: description"
+_ARG_LINE_RE = re.compile(r"\s*(\w+)\s*[-:]\s*(.+)")
+
+
+def _type_name(param_type: Any) -> str:
+    """Display name of a parameter annotation."""
+    return param_type.__name__ if hasattr(param_type, "__name__") else str(param_type)
+
+
+def _snapshot(value: Any) -> Any:
+    """Copy a search result for the cache, turning lists into tuples so nested sequences cannot change."""
+    if isinstance(value, dict):
+        return {key: _snapshot(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return tuple(_snapshot(item) for item in value)
+    return value
+
+
+@dataclass(slots=True)
 class ParamInfo:
     """Information about a tool parameter."""
 
@@ -24,7 +87,7 @@ class ParamInfo:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolMetadata:
     """Rich metadata about a tool function."""
 
@@ -35,8 +98,44 @@ class ToolMetadata:
     parameters: dict[str, ParamInfo]  # Name -> ParamInfo
     signature: inspect.Signature  # For validation
     category: str  # e.g., "base", "fs", "dba"
-    keywords: set[str]  # Indexed for search
+    keywords: frozenset[str]  # Indexed for search
     full_doc: str  # Complete docstring
+    short_summary: str  # First meaningful docstring line, shown in approximate search results
+
+    # Lowercased search fields, computed once at registration instead of on every query
+    name_lc: str = field(init=False, repr=False)
+    category_lc: str = field(init=False, repr=False)
+    description_lc: str = field(init=False, repr=False)
+    param_names_lc: tuple[str, ...] = field(init=False, repr=False)
+    search_text: str = field(init=False, repr=False)  # all of the above, for a single substring pre-check
+    # Parameter name sets for validate_arguments
+    required_params: frozenset[str] = field(init=False, repr=False)
+    all_params: frozenset[str] = field(init=False, repr=False)
+    # Serialised parameter schemas for search_tools (exact match) and list_tools_by_category
+    parameters_detail: dict[str, dict[str, Any]] = field(init=False, repr=False)
+    parameters_summary: dict[str, dict[str, Any]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.name_lc = self.name.lower()
+        self.category_lc = self.category.lower()
+        self.description_lc = self.description.lower()
+        self.param_names_lc = tuple(param_name.lower() for param_name in self.parameters)
+        self.search_text = "\0".join((self.name_lc, self.category_lc, self.description_lc, *self.param_names_lc))
+        self.required_params = frozenset(name for name, param in self.parameters.items() if param.required)
+        self.all_params = frozenset(self.parameters)
+        self.parameters_detail = {
+            name: {
+                "type": _type_name(param.type),
+                "required": param.required,
+                "default": str(param.default) if param.default is not None else None,
+                "description": param.description,
+            }
+            for name, param in self.parameters.items()
+        }
+        self.parameters_summary = {
+            name: {"type": _type_name(param.type), "required": param.required}
+            for name, param in self.parameters.items()
+        }
 
 
 class ContextCatalog:
@@ -45,9 +144,17 @@ class ContextCatalog:
     def __init__(self):
         self._tools: dict[str, ToolMetadata] = {}  # tool_name -> ToolMetadata
         self._tools_lower: dict[str, str] = {}  # lowercase_name -> actual_name (for exact match lookup)
-        self._keyword_index: dict[str, set[str]] = {}  # keyword -> set of tool_names
-        self._category_index: dict[str, set[str]] = {}  # category -> set of tool_names
+        self._keyword_index: defaultdict[str, set[str]] = defaultdict(set)  # keyword -> set of tool_names
+        self._category_index: defaultdict[str, set[str]] = defaultdict(set)  # category -> set of tool_names
+        self._tool_order: dict[str, int] = {}  # tool_name -> registration sequence (tie-break order in search)
+        self._tool_trigrams: defaultdict[str, set[str]] = defaultdict(set)  # trigram of search_text -> tool_names
         self.docs: dict[str, str] = {}  # Collection of documentation snippets
+        self._doc_name_lc: dict[str, str] = {}  # doc_name -> lowercased name
+        self._doc_content_lc: dict[str, str] = {}  # doc_name -> lowercased content
+        self._doc_trigrams: defaultdict[str, set[str]] = defaultdict(set)  # trigram of content -> doc_names
+        self._search_cache: OrderedDict[tuple, Any] = OrderedDict()  # (query, limit) -> search_tools result
+        self._docs_search_cache: OrderedDict[tuple, Any] = OrderedDict()  # (query, limit) -> search_docs result
+        self._search_cache_lock = threading.Lock()
 
     def register_tool(self, tool_func: Callable, category: str | None = None):
         """
@@ -58,24 +165,26 @@ class ContextCatalog:
             category: Optional category override (auto-detected from name if not provided)
         """
         metadata = self._extract_metadata(tool_func, category)
+        self._clear_search_caches()
 
         # Store in main registry
         self._tools[metadata.name] = metadata
+        self._tool_order.setdefault(metadata.name, len(self._tool_order))
 
         # Store lowercase mapping for fast exact match lookup
         self._tools_lower[metadata.name.lower()] = metadata.name
 
         # Index by category
-        if metadata.category not in self._category_index:
-            self._category_index[metadata.category] = set()
         self._category_index[metadata.category].add(metadata.name)
 
         # Index by keywords
         for keyword in metadata.keywords:
-            if keyword not in self._keyword_index:
-                self._keyword_index[keyword] = set()
             self._keyword_index[keyword].add(metadata.name)
 
+        # Index by trigrams of the searchable text, for substring queries
+        for trigram in self._trigrams(metadata.search_text):
+            self._tool_trigrams[trigram].add(metadata.name)
+
     def get_tool(self, tool_name: str) -> ToolMetadata | None:
         """
         Retrieve tool metadata by exact name.
@@ -117,6 +226,16 @@ class ContextCatalog:
         Returns:
             Dictionary with search results based on mode
         """
+        key = ((query or "").strip().lower(), limit)
+        cached = self._cached_search(self._search_cache, key)
+        if cached is not None:
+            return cached
+        result = self._search_tools_uncached(query, limit)
+        self._store_search(self._search_cache, key, result)
+        return result
+
+    def _search_tools_uncached(self, query: str, limit: int) -> dict[str, Any]:
+        """Run search_tools without consulting the result cache."""
         # Mode 1: List all tools (empty query)
         if not query or not query.strip():
             return {"match_type": "list_all", "total_count": len(self._tools), "tools": sorted(self._tools.keys())}
@@ -136,54 +255,58 @@ class ContextCatalog:
                     "category": exact_match.category,
                     "description": exact_match.description,
                     "full_documentation": exact_match.full_doc,
-                    "parameters": {
-                        name: {
-                            "type": param.type.__name__ if hasattr(param.type, "__name__") else str(param.type),
-                            "required": param.required,
-                            "default": str(param.default) if param.default is not None else None,
-                            "description": param.description,
-                        }
-                        for name, param in exact_match.parameters.items()
-                    },
+                    "parameters": {name: dict(detail) for name, detail in exact_match.parameters_detail.items()},
                 },
             }
 
         # Mode 3: Approximate match (keyword search)
         query_keywords = set(query_lower.split())
+        keyword_hits: set[str] = set()
+        for keyword in query_keywords:
+            keyword_hits.update(self._keyword_index.get(keyword, ()))
+        # Only keyword hits or tools containing the query somewhere can score. A tool contains the
+        # query only if it has every trigram of it; shorter queries fall back to scanning all tools.
+        if len(query_lower) >= 3:
+            postings = sorted((self._tool_trigrams.get(t, set()) for t in self._trigrams(query_lower)), key=len)
+            candidates = keyword_hits | set(postings[0]).intersection(*postings[1:])
+        else:
+            candidates = self._tools.keys()
         scored_results = []
 
-        for _tool_name, metadata in self._tools.items():
-            score = 0
-
-            # Partial name match
-            if query_lower in metadata.name.lower():
-                score += 100
-
-            # Category match
-            if query_lower == metadata.category.lower():
-                score += 75
-            elif query_lower in metadata.category.lower():
-                score += 50
+        for tool_name in sorted(candidates, key=self._tool_order.__getitem__):
+            metadata = self._tools[tool_name]
 
-            # Keyword matches
+            # Keyword matches (a set intersection, cheaper than any substring scan)
             matching_keywords = query_keywords & metadata.keywords
-            score += len(matching_keywords) * 10
-
-            # Description contains query
-            if query_lower in metadata.description.lower():
-                score += 20
-
-            # Parameter name matches
-            for param_name in metadata.parameters:
-                if query_lower in param_name.lower():
-                    score += 15
+            score = len(matching_keywords) * 10
+
+            # The per-field substring checks below can only add to the score when the query
+            # occurs somewhere in the tool's search text; one scan rules them all out otherwise
+            if query_lower in metadata.search_text:
+                # Partial name match
+                if query_lower in metadata.name_lc:
+                    score += 100
+
+                # Category match
+                if query_lower == metadata.category_lc:
+                    score += 75
+                elif query_lower in metadata.category_lc:
+                    score += 50
+
+                # Description contains query
+                if query_lower in metadata.description_lc:
+                    score += 20
+
+                # Parameter name matches
+                for param_name_lc in metadata.param_names_lc:
+                    if query_lower in param_name_lc:
+                        score += 15
 
             if score > 0:
                 scored_results.append((score, metadata))
 
-        # Sort by score and limit
-        scored_results.sort(reverse=True, key=lambda x: x[0])
-        top_results = scored_results[:limit]
+        # Top-k by score without sorting every match (ties keep registration order, as a stable sort would)
+        top_results = heapq.nlargest(limit, scored_results, key=lambda x: x[0])
 
         return {
             "match_type": "approximate",
@@ -192,13 +315,41 @@ class ContextCatalog:
                 {
                     "name": meta.name,
                     "category": meta.category,
-                    "summary": self._extract_short_summary(meta.full_doc),
+                    "summary": meta.short_summary,
                     "score": score,
                 }
                 for score, meta in top_results
             ],
         }
 
+    def _cached_search(self, cache: OrderedDict[tuple, Any], key: tuple) -> Any | None:
+        """Return a shallow copy of a cached search result (most recently used first on eviction), or None.
+
+        The snapshot's nested values are shared between hits, so callers must treat them as read-only.
+        """
+        with self._search_cache_lock:
+            result = cache.get(key)
+            if result is not None:
+                cache.move_to_end(key)
+        if result is None:
+            return None
+        return dict(result) if isinstance(result, dict) else list(result)
+
+    def _store_search(self, cache: OrderedDict[tuple, Any], key: tuple, result: Any):
+        """Cache a snapshot of a search result, evicting the least recently used entry when full."""
+        result = _snapshot(result)
+        with self._search_cache_lock:
+            cache[key] = result
+            cache.move_to_end(key)
+            while len(cache) > _SEARCH_CACHE_MAXSIZE:
+                cache.popitem(last=False)
+
+    def _clear_search_caches(self):
+        """Drop cached search results; the catalog contents are changing."""
+        with self._search_cache_lock:
+            self._search_cache.clear()
+            self._docs_search_cache.clear()
+
     def _extract_short_summary(self, docstring: str) -> str:
         """
         Extract the first meaningful (non-blank) line from a docstring.
@@ -236,23 +387,17 @@ class ContextCatalog:
         if not metadata:
             return False, f"Tool '{tool_name}' not found"
 
-        # Check for missing required parameters
-        missing = []
-        for param_name, param_info in metadata.parameters.items():
-            if param_info.required and param_name not in kwargs:
-                missing.append(param_name)
-
+        # Check for missing required parameters (reported in signature order)
+        missing = metadata.required_params - kwargs.keys()
         if missing:
-            return False, f"Missing required parameters: {', '.join(missing)}"
-
-        # Check for unexpected parameters
-        unexpected = []
-        for param_name in kwargs:
-            if param_name not in metadata.parameters:
-                unexpected.append(param_name)
+            ordered = [name for name in metadata.parameters if name in missing]
+            return False, f"Missing required parameters: {', '.join(ordered)}"
 
+        # Check for unexpected parameters (reported in the order given)
+        unexpected = kwargs.keys() - metadata.all_params
         if unexpected:
-            return False, f"Unexpected parameters: {', '.join(unexpected)}"
+            ordered = [name for name in kwargs if name in unexpected]
+            return False, f"Unexpected parameters: {', '.join(ordered)}"
 
         return True, ""
 
@@ -280,13 +425,7 @@ class ContextCatalog:
             {
                 "name": self._tools[name].name,
                 "description": self._tools[name].description,
-                "parameters": {
-                    pname: {
-                        "type": pinfo.type.__name__ if hasattr(pinfo.type, "__name__") else str(pinfo.type),
-                        "required": pinfo.required,
-                    }
-                    for pname, pinfo in self._tools[name].parameters.items()
-                },
+                "parameters": self._tools[name].parameters_summary,
             }
             for name in sorted(tool_names)
         ]
@@ -304,23 +443,25 @@ class ContextCatalog:
         """
         # Name extraction
         raw_name = func.__name__
-        tool_name = raw_name[7:] if raw_name.startswith("handle_") else raw_name
+        tool_name = sys.intern(raw_name[7:] if raw_name.startswith("handle_") else raw_name)  # dict key in every index
 
         # Auto-detect category from name if not provided
         if category is None:
             category = tool_name.split("_")[0] if "_" in tool_name else "misc"
+        category = sys.intern(category)  # shared by every tool in the category
 
         # Description from docstring
         full_doc = inspect.getdoc(func) or "No description available"
-        description = full_doc.split("\n")[0].strip()  # First line as summary
+        description = full_doc.split("\n", 1)[0].strip()  # First line as summary
 
         # Parameter extraction
         sig = inspect.signature(func)
         parameters = {}
+        param_descriptions = self._parse_arguments_section(full_doc)
 
         for param_name, param in sig.parameters.items():
             # Skip internal params
-            if param_name in {"conn", "tool_name", "fs_config", "args", "kwargs"}:
+            if param_name in _INTERNAL_PARAMS:
                 continue
 
             # Handle *args and **kwargs
@@ -332,54 +473,21 @@ class ContextCatalog:
             default_val = param.default if has_default else None
 
             # Extract description from docstring (parse Arguments section)
-            param_desc = self._extract_param_description(full_doc, param_name)
+            param_desc = param_descriptions.get(param_name, "")
 
-            parameters[param_name] = ParamInfo(
+            parameters[sys.intern(param_name)] = ParamInfo(
                 type=param_type, required=not has_default, default=default_val, description=param_desc
             )
 
-        # Build keyword index
-        keywords = set()
-        keywords.add(tool_name.lower())
-        keywords.update(tool_name.lower().split("_"))
-
-        # Add words from description (filter common words)
-        stopwords = {
-            "a",
-            "an",
-            "and",
-            "are",
-            "as",
-            "at",
-            "be",
-            "by",
-            "for",
-            "from",
-            "has",
-            "he",
-            "in",
-            "is",
-            "it",
-            "its",
-            "of",
-            "on",
-            "that",
-            "the",
-            "to",
-            "was",
-            "will",
-            "with",
-            "via",
-            "this",
-            "or",
-            "if",
-        }
-        desc_words = re.findall(r"\b\w+\b", description.lower())
-        keywords.update(w for w in desc_words if len(w) > 2 and w not in stopwords)  # noqa: PLR2004
-
-        # Add parameter names
-        keywords.update(param_name.lower() for param_name in parameters)
-        keywords.discard("")  # Remove empty strings
+        # Build keyword index: the name and its parts, description words (filtering common words)
+        # and parameter names, in one pass that also drops empty strings
+        name_lc = tool_name.lower()
+        desc_words = (w for w in _WORD_RE.findall(description.lower()) if len(w) > 2 and w not in _STOPWORDS)
+        keywords = frozenset(
+            sys.intern(word)
+            for word in itertools.chain((name_lc,), name_lc.split("_"), desc_words, map(str.lower, parameters))
+            if word
+        )
 
         return ToolMetadata(
             name=tool_name,
@@ -391,43 +499,42 @@ class ContextCatalog:
             category=category,
             keywords=keywords,
             full_doc=full_doc,
+            short_summary=self._extract_short_summary(full_doc),
         )
 
-    def _extract_param_description(self, docstring: str, param_name: str) -> str:
+    def _parse_arguments_section(self, docstring: str) -> dict[str, str]:
         """
-        Extract parameter description from docstring.
+        Extract all parameter descriptions from a docstring in a single pass.
 
         Args:
             docstring: The full docstring
-            param_name: The parameter name to find
 
         Returns:
-            Description string or empty string if not found
+            Dictionary of parameter name -> description (first occurrence wins)
         """
-        # Look for "Arguments:" section
-        lines = docstring.split("\n")
+        descriptions: dict[str, str] = {}
         in_args_section = False
 
-        for _i, line in enumerate(lines):
+        for line in docstring.split("\n"):
             stripped = line.strip()
 
-            # Detect Arguments section
-            if stripped.lower() in ("arguments:", "args:", "parameters:", "params:"):
+            # Detect Arguments section (only header-like lines are lowercased)
+            if stripped.endswith(":") and stripped.lower() in _ARGS_SECTION_HEADERS:
                 in_args_section = True
                 continue
 
-            # Exit arguments section on next section header or blank line
-            if in_args_section and stripped and stripped.endswith(":") and stripped != f"{param_name}:":
+            if not in_args_section:
+                continue
+
+            # Exit arguments section on next section header
+            if stripped.endswith(":"):
                 break
 
-            # Look for parameter line
-            if in_args_section:
-                # Match patterns like: "param_name - description" or "param_name: description"
-                match = re.match(rf"\s*{re.escape(param_name)}\s*[-:]\s*(.+)", line)
-                if match:
-                    return match.group(1).strip()
+            match = _ARG_LINE_RE.match(line)
+            if match:
+                descriptions.setdefault(match.group(1), match.group(2).strip())
 
-        return ""
+        return descriptions
 
     # Documentation methods (for future extension)
 
@@ -439,7 +546,25 @@ class ContextCatalog:
             doc_name: The name/key for the documentation snippet
             doc_content: The content of the documentation snippet
         """
+        self._clear_search_caches()
+        previous_lc = self._doc_content_lc.get(doc_name)
+        if previous_lc is not None:
+            for trigram in self._trigrams(previous_lc):
+                names = self._doc_trigrams.get(trigram)
+                if names is not None:
+                    names.discard(doc_name)
+
         self.docs[doc_name] = doc_content
+        self._doc_name_lc[doc_name] = doc_name.lower()
+        content_lc = doc_content.lower()
+        self._doc_content_lc[doc_name] = content_lc
+        for trigram in self._trigrams(content_lc):
+            self._doc_trigrams[trigram].add(doc_name)
+
+    @staticmethod
+    def _trigrams(text: str) -> set[str]:
+        """Return the set of 3-character substrings of text."""
+        return {text[i : i + 3] for i in range(len(text) - 2)}
 
     def get_doc(self, doc_name: str) -> str | None:
         """
@@ -464,24 +589,38 @@ class ContextCatalog:
         Returns:
             List of matching documentation snippets
         """
+        key = (query.lower(), limit)
+        cached = self._cached_search(self._docs_search_cache, key)
+        if cached is not None:
+            return cached
+        result = self._search_docs_uncached(query, limit)
+        self._store_search(self._docs_search_cache, key, result)
+        return result
+
+    def _search_docs_uncached(self, query: str, limit: int) -> list[dict[str, str]]:
+        """Run search_docs without consulting the result cache."""
         query_lower = query.lower()
         results = []
 
+        # Only docs containing every trigram of the query can contain the query itself
+        content_candidates: set[str] | None = None
+        if len(query_lower) >= 3:
+            postings = sorted((self._doc_trigrams.get(t, set()) for t in self._trigrams(query_lower)), key=len)
+            content_candidates = set(postings[0]).intersection(*postings[1:])
+
         for name, content in self.docs.items():
             score = 0
 
-            if query_lower in name.lower():
+            if query_lower in self._doc_name_lc[name]:
                 score += 100
 
-            if query_lower in content.lower():
+            if (content_candidates is None or name in content_candidates) and query_lower in self._doc_content_lc[name]:
                 score += 50
 
             if score > 0:
                 results.append((score, name, content))
 
-        results.sort(reverse=True, key=lambda x: x[0])
-
         return [
             {"name": name, "content": content[:500] + "..." if len(content) > 500 else content}
-            for score, name, content in results[:limit]
+            for score, name, content in heapq.nlargest(limit, results, key=lambda x: x[0])
         ]
@@ -1,6 +1,8 @@
 import logging
 from contextlib import redirect_stderr, redirect_stdout
+from functools import lru_cache
 from io import StringIO
+from typing import Any
 
 # Suppress stdout/stderr during tdfs4ds import to prevent contamination of MCP JSON protocol
 stdout_buffer = StringIO()
@@ -9,7 +11,9 @@ with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
     import tdfs4ds
 from teradatasql import TeradataConnection
 
-from teradata_mcp_server.tools.utils import create_response, rows_to_json
+from teradata_mcp_server.tools.utils import create_response, iter_rows_json
+
+from .fs_utils import _connect_feature_store
 
 logger = logging.getLogger("teradata_mcp_server")
 
@@ -17,6 +21,48 @@ from teradata_mcp_server.tools.utils import serialize_teradata_types
 
 # ------------------ Do not make changes above  ------------------#
 
+# Feature catalog columns returned by fs_getFeatures (the catalog's temporal bookkeeping columns are left out)
+FEATURE_CATALOG_COLUMNS = (
+    "FEATURE_ID",
+    "FEATURE_NAME",
+    "FEATURE_TABLE",
+    "FEATURE_DATABASE",
+    "FEATURE_VIEW",
+    "ENTITY_NAME",
+    "DATA_DOMAIN",
+)
+
+
+def _check_feature_store(database_name: str, metadata: dict, absent_result: Any = None) -> dict | None:
+    """Connect tdfs4ds to database_name and return the error response a handler should send, or None.
+
+    Args:
+        database_name: Database expected to hold the feature store.
+        metadata: The handler's response metadata.
+        absent_result: Result to return when there is no feature store (defaults to an error message).
+    """
+    try:
+        is_a_feature_store = _connect_feature_store(database_name)
+    except Exception as e:
+        logger.error("Error connecting to Teradata Feature Store: %s", e)
+        return create_response({"error": str(e)}, metadata)
+
+    if not is_a_feature_store:
+        if absent_result is None:
+            absent_result = {"error": f"There is no feature store in {database_name}"}
+        return create_response(absent_result, metadata)
+    return None
+
+
+@lru_cache(maxsize=1)
+def _dataset_builders():
+    """Import the tdfs4ds dataset helpers once and return (get_feature_versions, build_dataset)."""
+    # Suppress stdout/stderr during tdfs4ds import to prevent contamination of MCP JSON protocol
+    with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+        from tdfs4ds import build_dataset
+        from tdfs4ds.feature_store.feature_query_retrieval import get_feature_versions
+    return get_feature_versions, build_dataset
+
 
 # ------------------ Tool  ------------------#
 # Feature Store existence tool
@@ -31,23 +77,18 @@ def handle_fs_isFeatureStorePresent(conn: TeradataConnection, database_name: str
         database_name (str): The name of the database to check for the feature store.
     """
 
-    logger.info(f"Tool: handle_fs_isFeatureStorePresent: Args: database_name: {database_name}")
+    logger.info("Tool: handle_fs_isFeatureStorePresent: Args: database_name: %s", database_name)
+    metadata = {"tool_name": "fs_isFeatureStorePresent", "database_name": database_name}
 
     data: list | bool = False
 
     try:
-        data = tdfs4ds.connect(database=database_name)
+        data = _connect_feature_store(database_name)
     except Exception as e:
-        logger.error(f"Error connecting to Teradata Feature Store: {e}")
-        return create_response(
-            {"error": str(e)}, {"tool_name": "fs_isFeatureStorePresent", "database_name": database_name}
-        )
+        logger.error("Error connecting to Teradata Feature Store: %s", e)
+        return create_response({"error": str(e)}, metadata)
 
-    metadata = {
-        "tool_name": "fs_isFeatureStorePresent",
-        "database_name": database_name,
-    }
-    logger.info(f"Tool: handle_fs_isFeatureStorePresent: Metadata: {metadata}")
+    logger.info("Tool: handle_fs_isFeatureStorePresent: Metadata: %s", metadata)
     return create_response(data, metadata)
 
 
@@ -62,12 +103,9 @@ def handle_fs_getDataDomains(conn: TeradataConnection, fs_config, *args, **kwarg
     """
 
     database_name = fs_config.database_name
-    logger.info(f"Tool: handle_fs_getDataDomains: Args: database_name: {database_name}")
+    logger.info("Tool: handle_fs_getDataDomains: Args: database_name: %s", database_name)
 
-    metadata = {
-        "tool_name": "fs_getDataDomains",
-        "database_name": fs_config.database_name,
-    }
+    metadata = {"tool_name": "fs_getDataDomains", "database_name": database_name}
 
     if not database_name:
         logger.error("Database name is not provided.")
@@ -75,28 +113,18 @@ def handle_fs_getDataDomains(conn: TeradataConnection, fs_config, *args, **kwarg
 
     data: list | bool = False
 
-    try:
-        is_a_feature_store = tdfs4ds.connect(database=database_name)
-        if not is_a_feature_store:
-            return create_response(False, {"tool_name": "handle_fs_getDataDomains", "database_name": database_name})
-    except Exception as e:
-        logger.error(f"Error connecting to Teradata Feature Store: {e}")
-        return create_response(
-            {"error": str(e)}, {"tool_name": "handle_fs_getDataDomains", "database_name": database_name}
-        )
+    error = _check_feature_store(database_name, metadata, absent_result=False)
+    if error is not None:
+        return error
 
     sql_query = f"""
     SELECT DISTINCT DATA_DOMAIN FROM {fs_config.feature_catalog}
     """
-    logger.info(sql_query)
+    logger.debug(sql_query)
     with conn.cursor() as cur:
-        rows = cur.execute(sql_query)
-        data = rows_to_json(cur.description, rows.fetchall())
-        metadata = {
-            "tool_name": "fs_getDataDomains",
-            "database_name": fs_config.database_name,
-        }
-        logger.info(f"Tool: handle_fs_getDataDomains: Metadata: {metadata}")
+        cur.execute(sql_query)
+        data = list(iter_rows_json(cur))
+        logger.info("Tool: handle_fs_getDataDomains: Metadata: %s", metadata)
         return create_response(data, metadata)
 
 
@@ -111,28 +139,17 @@ def handle_fs_featureStoreContent(conn: TeradataConnection, fs_config, *args, **
     """
 
     database_name = fs_config.database_name
-    logger.info(f"Tool: handle_fs_featureStoreContent: Args: database_name: {database_name}")
-    metadata = {
-        "tool_name": "fs_featureStoreContent",
-        "database_name": fs_config.database_name,
-    }
+    logger.info("Tool: handle_fs_featureStoreContent: Args: database_name: %s", database_name)
+    metadata = {"tool_name": "fs_featureStoreContent", "database_name": database_name}
 
     if not database_name:
         logger.error("Database name is not provided.")
         return create_response({"error": "The database name for the feature store is not specified."}, metadata)
     data: list | bool = False
 
-    try:
-        is_a_feature_store = tdfs4ds.connect(database=database_name)
-        if not is_a_feature_store:
-            return create_response(
-                False, {"tool_name": "handle_fs_featureStoreContent", "database_name": database_name}
-            )
-    except Exception as e:
-        logger.error(f"Error connecting to Teradata Feature Store with tdfs4ds {tdfs4ds.__version__}: {e}")
-        return create_response(
-            {"error": str(e)}, {"tool_name": "handle_fs_featureStoreContent", "database_name": database_name}
-        )
+    error = _check_feature_store(database_name, metadata, absent_result=False)
+    if error is not None:
+        return error
 
     sql_query = f"""
     SELECT DATA_DOMAIN, ENTITY_NAME, count(FEATURE_ID) AS FEATURE_COUNT
@@ -141,10 +158,10 @@ def handle_fs_featureStoreContent(conn: TeradataConnection, fs_config, *args, **
     """
 
     with conn.cursor() as cur:
-        rows = cur.execute(sql_query)
-        data = rows_to_json(cur.description, rows.fetchall())
+        cur.execute(sql_query)
+        data = list(iter_rows_json(cur))
 
-        logger.info(f"Tool: handle_fs_featureStoreContent: Metadata: {metadata}")
+        logger.info("Tool: handle_fs_featureStoreContent: Metadata: %s", metadata)
         return create_response(data, metadata)
 
 
@@ -160,23 +177,12 @@ def handle_fs_getFeatureDataModel(conn: TeradataConnection, fs_config, *args, **
     """
 
     database_name = fs_config.database_name
-    logger.info(f"Tool: handle_fs_getFeatureDataModel: Args: database_name: {database_name}")
-
-    is_a_feature_store = False
-
-    try:
-        is_a_feature_store = tdfs4ds.connect(database=database_name)
-    except Exception as e:
-        logger.error(f"Error connecting to Teradata Feature Store: {e}")
-        return create_response(
-            {"error": str(e)}, {"tool_name": "handle_fs_getFeatureDataModel", "database_name": database_name}
-        )
+    logger.info("Tool: handle_fs_getFeatureDataModel: Args: database_name: %s", database_name)
+    metadata = {"tool_name": "fs_getFeatureDataModel", "database_name": database_name}
 
-    if not is_a_feature_store:
-        return create_response(
-            {"error": f"There is no feature store in {database_name}"},
-            {"tool_name": "handle_fs_getFeatureDataModel", "database_name": database_name},
-        )
+    error = _check_feature_store(database_name, metadata)
+    if error is not None:
+        return error
 
     data = {}
     data["FEATURE CATALOG"] = {
@@ -192,11 +198,7 @@ def handle_fs_getFeatureDataModel(conn: TeradataConnection, fs_config, *args, **
         "DESCRIPTION": "lists the available datasets",
     }
 
-    metadata = {
-        "tool_name": "fs_getFeatureDataModel",
-        "database_name": database_name,
-    }
-    logger.info(f"Tool: handle_fs_getFeatureDataModel: Metadata: {metadata}")
+    logger.info("Tool: handle_fs_getFeatureDataModel: Metadata: %s", metadata)
     return create_response(data, metadata)
 
 
@@ -211,31 +213,17 @@ def handle_fs_getAvailableEntities(conn: TeradataConnection, fs_config, *args, *
     List the available entities for a given data domain. Requires a configured `database_name` and `data_domain` and  `entity` in the feature store config. Use this to explore which entities can be used when building a dataset.
     """
     database_name = fs_config.database_name
-    logger.info(f"Tool: handle_fs_getAvailableEntities: Args: database_name: {database_name}")
+    logger.info("Tool: handle_fs_getAvailableEntities: Args: database_name: %s", database_name)
+    metadata = {"tool_name": "fs_getAvailableEntities", "database_name": database_name}
 
-    is_a_feature_store = False
-
-    try:
-        is_a_feature_store = tdfs4ds.connect(database=database_name)
-    except Exception as e:
-        logger.error(f"Error connecting to Teradata Feature Store: {e}")
-        return create_response(
-            {"error": str(e)}, {"tool_name": "handle_fs_getAvailableEntities", "database_name": database_name}
-        )
-
-    if not is_a_feature_store:
-        return create_response(
-            {"error": f"There is no feature store in {database_name}"},
-            {"tool_name": "handle_fs_getAvailableEntities", "database_name": database_name},
-        )
+    error = _check_feature_store(database_name, metadata)
+    if error is not None:
+        return error
 
     # set the data domain:
     data_domain = fs_config.data_domain
-    if data_domain is None or data_domain == "":
-        return create_response(
-            {"error": "The data domain is not specified"},
-            {"tool_name": "handle_fs_getAvailableEntities", "database_name": database_name},
-        )
+    if not data_domain:
+        return create_response({"error": "The data domain is not specified"}, metadata)
 
     tdfs4ds.DATA_DOMAIN = data_domain
 
@@ -249,13 +237,11 @@ def handle_fs_getAvailableEntities(conn: TeradataConnection, fs_config, *args, *
     try:
         data = get_list_entity()
     except Exception as e:
-        logger.error(f"Error retrieving entities: {e}")
-        return create_response(
-            {"error": str(e)}, {"tool_name": "handle_fs_getAvailableEntities", "database_name": database_name}
-        )
+        logger.error("Error retrieving entities: %s", e)
+        return create_response({"error": str(e)}, metadata)
 
-    metadata = {"tool_name": "fs_getAvailableEntities", "database_name": database_name, "data_domain": data_domain}
-    logger.info(f"Tool: handle_fs_getAvailableEntities: Metadata: {metadata}")
+    metadata["data_domain"] = data_domain
+    logger.info("Tool: handle_fs_getAvailableEntities: Metadata: %s", metadata)
     return create_response(data, metadata)
 
 
@@ -271,37 +257,25 @@ def handle_fs_getAvailableDatasets(conn: TeradataConnection, fs_config, *args, *
     """
 
     database_name = fs_config.database_name
-    logger.info(f"Tool: handle_fs_getAvailableDatasets: Args: database_name: {database_name}")
-
-    is_a_feature_store = False
-
-    try:
-        is_a_feature_store = tdfs4ds.connect(database=database_name)
-    except Exception as e:
-        logger.error(f"Error connecting to Teradata Feature Store: {e}")
-        return create_response(
-            {"error": str(e)}, {"tool_name": "handle_fs_getAvailableDatasets", "database_name": database_name}
-        )
+    logger.info("Tool: handle_fs_getAvailableDatasets: Args: database_name: %s", database_name)
+    metadata = {"tool_name": "fs_getAvailableDatasets", "database_name": database_name}
 
-    if not is_a_feature_store:
-        return create_response(
-            {"error": f"There is no feature store in {database_name}"},
-            {"tool_name": "handle_fs_getAvailableDatasets", "database_name": database_name},
-        )
+    error = _check_feature_store(database_name, metadata)
+    if error is not None:
+        return error
 
+    # Read the dataset catalog view through the cursor: the previous DataFrame round-trip
+    # materialised it in pandas only for the frame to be stringified by create_response
+    dataset_catalog = fs_config.dataset_catalog or f"{database_name}.FS_V_FS_DATASET_CATALOG"
     try:
-        data = tdfs4ds.dataset_catalog().to_pandas()
+        with conn.cursor() as cur:
+            cur.execute(f"SELECT * FROM {dataset_catalog}")
+            data = list(iter_rows_json(cur))
     except Exception as e:
-        logger.error(f"Error retrieving available datasets: {e}")
-        return create_response(
-            {"error": str(e)}, {"tool_name": "handle_fs_getAvailableDatasets", "database_name": database_name}
-        )
+        logger.error("Error retrieving available datasets: %s", e)
+        return create_response({"error": str(e)}, metadata)
 
-    metadata = {
-        "tool_name": "fs_getAvailableDatasets",
-        "database_name": database_name,
-    }
-    logger.info(f"Tool: handle_fs_getAvailableDatasets: Metadata: {metadata}")
+    logger.info("Tool: handle_fs_getAvailableDatasets: Metadata: %s", metadata)
     return create_response(data, metadata)
 
 
@@ -317,73 +291,47 @@ def handle_fs_getFeatures(conn: TeradataConnection, fs_config, *args, **kwargs):
     """
 
     database_name = fs_config.database_name
-    logger.info(f"Tool: handle_fs_getFeatures: Args: database_name: {database_name}")
+    logger.info("Tool: handle_fs_getFeatures: Args: database_name: %s", database_name)
+    metadata = {"tool_name": "fs_getFeatures", "database_name": database_name}
 
     if not database_name:
-        return create_response({"error": "Database name is not specified"}, {"tool_name": "handle_fs_getFeatures"})
+        return create_response({"error": "Database name is not specified"}, metadata)
 
-    try:
-        is_a_feature_store = tdfs4ds.connect(database=database_name)
-    except Exception as e:
-        logger.error(f"Error connecting to Teradata Feature Store: {e}")
-        return create_response(
-            {"error": str(e)}, {"tool_name": "handle_fs_getFeatures", "database_name": database_name}
-        )
-
-    if not is_a_feature_store:
-        return create_response(
-            {"error": f"There is no feature store in {database_name}"},
-            {"tool_name": "handle_fs_getFeatures", "database_name": database_name},
-        )
+    error = _check_feature_store(database_name, metadata)
+    if error is not None:
+        return error
 
     # Validate required fields
     data_domain = fs_config.data_domain
     entity = fs_config.entity
     feature_catalog = fs_config.feature_catalog
 
-    if not data_domain:
-        return create_response(
-            {"error": "The data domain is not specified"},
-            {"tool_name": "handle_fs_getFeatures", "database_name": database_name},
-        )
-
-    if not entity:
-        return create_response(
-            {"error": "The entity name is not specified"},
-            {"tool_name": "handle_fs_getFeatures", "database_name": database_name},
-        )
-
-    if not feature_catalog:
-        return create_response(
-            {"error": "The feature catalog table is not specified"},
-            {"tool_name": "handle_fs_getFeatures", "database_name": database_name},
-        )
+    missing = [
+        name
+        for name, value in (("data_domain", data_domain), ("entity", entity), ("feature_catalog", feature_catalog))
+        if not value
+    ]
+    if missing:
+        return create_response({"error": f"Not specified in the feature store config: {', '.join(missing)}"}, metadata)
 
     tdfs4ds.DATA_DOMAIN = data_domain
 
     try:
+        # Bound values keep the statement text constant per catalog, so Teradata can reuse its plan
         sql_query = f"""
-            SEL * FROM {feature_catalog}
-            WHERE DATA_DOMAIN = '{data_domain}' AND ENTITY_NAME = '{entity}'
+            SEL {", ".join(FEATURE_CATALOG_COLUMNS)} FROM {feature_catalog}
+            WHERE DATA_DOMAIN = ? AND ENTITY_NAME = ?
         """
         with conn.cursor() as cur:
-            rows = cur.execute(sql_query)
-            data = rows_to_json(cur.description, rows.fetchall())
+            cur.execute(sql_query, [data_domain, entity])
+            data = list(iter_rows_json(cur))
 
     except Exception as e:
-        logger.error(f"Error retrieving features: {e}")
-        return create_response(
-            {"error": str(e)}, {"tool_name": "handle_fs_getFeatures", "database_name": database_name}
-        )
+        logger.error("Error retrieving features: %s", e)
+        return create_response({"error": str(e)}, metadata)
 
-    metadata = {
-        "tool_name": "fs_getFeatures",
-        "database_name": database_name,
-        "data_domain": data_domain,
-        "entity": entity,
-        "num_features": len(data),
-    }
-    logger.info(f"Tool: handle_fs_getFeatures: Metadata: {metadata}")
+    metadata.update(data_domain=data_domain, entity=entity, num_features=len(data))
+    logger.info("Tool: handle_fs_getFeatures: Metadata: %s", metadata)
     return create_response(data, metadata)
 
 
@@ -413,55 +361,30 @@ def handle_fs_createDataset(  # noqa: PLR0917
     """
 
     database_name = fs_config.database_name
-    logger.info(f"Tool: handle_fs_createDataset: Args: database_name: {database_name}")
-
-    is_a_feature_store = False
+    logger.info("Tool: handle_fs_createDataset: Args: database_name: %s", database_name)
+    metadata = {"tool_name": "fs_createDataset", "database_name": database_name}
 
-    try:
-        is_a_feature_store = tdfs4ds.connect(database=database_name)
-    except Exception as e:
-        logger.error(f"Error connecting to Teradata Feature Store: {e}")
-        return create_response(
-            {"error": str(e)}, {"tool_name": "handle_fs_createDataset", "database_name": database_name}
-        )
-
-    if not is_a_feature_store:
-        return create_response(
-            {"error": f"There is no feature store in {database_name}"},
-            {"tool_name": "handle_fs_createDataset", "database_name": database_name},
-        )
+    error = _check_feature_store(database_name, metadata)
+    if error is not None:
+        return error
 
     # set the data domain:
     data_domain = fs_config.data_domain
-    if data_domain is None or data_domain == "":
-        return create_response(
-            {"error": "The data domain is not specified"},
-            {"tool_name": "handle_fs_createDataset", "database_name": database_name},
-        )
+    if not data_domain:
+        return create_response({"error": "The data domain is not specified"}, metadata)
 
     tdfs4ds.DATA_DOMAIN = data_domain
 
-    # get the feature version:
-    # Suppress stdout/stderr during tdfs4ds import to prevent contamination of MCP JSON protocol
-    stdout_buffer = StringIO()
-    stderr_buffer = StringIO()
-    with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
-        from tdfs4ds.feature_store.feature_query_retrieval import get_feature_versions
+    get_feature_versions, build_dataset = _dataset_builders()
 
+    # get the feature version:
     try:
         feature_selection = get_feature_versions(entity_name=entity_name, features=feature_selection)
     except Exception as e:
-        logger.error(f"Error retrieving feature versions: {e}")
-        return create_response(
-            {"error": str(e)}, {"tool_name": "handle_fs_createDataset", "database_name": database_name}
-        )
+        logger.error("Error retrieving feature versions: %s", e)
+        return create_response({"error": str(e)}, metadata)
 
     # build the dataset
-    # Suppress stdout/stderr during tdfs4ds import to prevent contamination of MCP JSON protocol
-    stdout_buffer = StringIO()
-    stderr_buffer = StringIO()
-    with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
-        from tdfs4ds import build_dataset
     try:
         dataset = build_dataset(
             entity_id=entity_name,
@@ -471,21 +394,17 @@ def handle_fs_createDataset(  # noqa: PLR0917
             comment="my dataset for curve clustering",
         )
     except Exception as e:
-        logger.error(f"Error creating dataset: {e}")
-        return create_response(
-            {"error": str(e)}, {"tool_name": "handle_fs_createDataset", "database_name": database_name}
-        )
+        logger.error("Error creating dataset: %s", e)
+        return create_response({"error": str(e)}, metadata)
 
     data = {"VIEW NAME": target_database + "." + dataset_name}
 
-    metadata = {
-        "tool_name": "fs_createDataset",
-        "database_name": database_name,
-        "entity_name": entity_name,
-        "data_domain": data_domain,
-        "feature_selection": feature_selection,
-        "dataset_name": dataset_name,
-        "target_database": target_database,
-    }
-    logger.info(f"Tool: handle_fs_createDataset: Metadata: {metadata}")
+    metadata.update(
+        entity_name=entity_name,
+        data_domain=data_domain,
+        feature_selection=feature_selection,
+        dataset_name=dataset_name,
+        target_database=target_database,
+    )
+    logger.info("Tool: handle_fs_createDataset: Metadata: %s", metadata)
     return create_response(data, metadata)
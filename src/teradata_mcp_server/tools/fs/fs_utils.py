@@ -1,4 +1,6 @@
 import logging
+import threading
+import time
 from contextlib import redirect_stderr, redirect_stdout
 from io import StringIO
 
@@ -14,6 +16,32 @@ with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
 
 logger = logging.getLogger("teradata_mcp_server")
 
+# tdfs4ds.connect() checks the database on every call; a positive answer is reused for this long
+FS_CONNECT_TTL_SECONDS = 300
+_fs_connected: tuple[str, float, object] | None = None  # (database_name, monotonic check time, connect() result)
+_fs_connect_lock = threading.Lock()
+
+
+def _connect_feature_store(database_name: str):
+    """Point tdfs4ds at database_name, skipping the round-trip if it was confirmed within the TTL.
+
+    tdfs4ds keeps the connected feature store in module state, so only the most recent
+    database is remembered; switching databases always reconnects.
+    """
+    global _fs_connected
+    with _fs_connect_lock:
+        if (
+            _fs_connected is not None
+            and _fs_connected[0] == database_name
+            and time.monotonic() - _fs_connected[1] < FS_CONNECT_TTL_SECONDS
+        ):
+            return _fs_connected[2]
+        _fs_connected = None
+        result = tdfs4ds.connect(database=database_name)
+        if result:
+            _fs_connected = (database_name, time.monotonic(), result)
+        return result
+
 
 class FeatureStoreConfig(BaseModel):
     """
@@ -63,20 +91,20 @@ class FeatureStoreConfig(BaseModel):
         data_domain: str | None = None,
         entity: str | None = None,
     ) -> "FeatureStoreConfig":
-        if database_name and tdfs4ds.connect(database=database_name):
-            logger.info(f"connected to the feature store of the {database_name} database")
+        if database_name and _connect_feature_store(database_name):
+            logger.info("connected to the feature store of the %s database", database_name)
             # Reset data_domain if DB name changes
             if not (self.database_name and self.database_name.upper() == database_name.upper()):
                 self.data_domain = None
 
             self.database_name = database_name
-            logger.info(f"connected to the feature store of the {database_name} database")
+            logger.info("connected to the feature store of the %s database", database_name)
             self.feature_catalog = f"{database_name}.{tdfs4ds.FEATURE_CATALOG_NAME_VIEW}"
-            logger.info(f"feature catalog {self.feature_catalog}")
+            logger.info("feature catalog %s", self.feature_catalog)
             self.process_catalog = f"{database_name}.{tdfs4ds.PROCESS_CATALOG_NAME_VIEW}"
-            logger.info(f"process catalog {self.process_catalog}")
+            logger.info("process catalog %s", self.process_catalog)
             self.dataset_catalog = f"{database_name}.FS_V_FS_DATASET_CATALOG"  # <- fixed line
-            logger.info(f"dataset catalog {self.dataset_catalog}")
+            logger.info("dataset catalog %s", self.dataset_catalog)
 
         if self.database_name is not None and data_domain is not None:
             stmt = text(f"SELECT COUNT(*) AS N FROM {self.feature_catalog} WHERE UPPER(data_domain)=:domain")
@@ -36,6 +36,7 @@ Author:  Paul Dancer — Teradata Global Field Tech
 
 import fnmatch
 import logging
+import re
 from collections import defaultdict, deque
 
 from teradatasql import TeradataConnection
@@ -316,6 +317,8 @@ def handle_graph_bfsLevels(  # noqa: PLR0917
         edges_total = 0
         edges_excluded = 0
 
+        excl_re = _compile_like_patterns(excl_patterns)
+
         for row in raw_rows:
             src_fq = _val(row, col_idx, "src_object_name_fq")
             tgt_fq = _val(row, col_idx, "tgt_object_name_fq")
@@ -332,7 +335,7 @@ def handle_graph_bfsLevels(  # noqa: PLR0917
             edges_total += 1
 
             # Apply exclude_objects filter — both endpoints checked
-            if excl_patterns and (_matches_any(src_fq, excl_patterns) or _matches_any(tgt_fq, excl_patterns)):
+            if excl_re is not None and (_matches_any(src_fq, excl_re) or _matches_any(tgt_fq, excl_re)):
                 edges_excluded += 1
                 continue
 
@@ -582,27 +585,39 @@ def handle_graph_bfsLevels(  # noqa: PLR0917
 # parse_csv_patterns is imported from _graph_utils.
 
 
-def _matches_any(fq_name: str, patterns: list[str]) -> bool:
+def _compile_like_patterns(patterns: list[str]) -> re.Pattern | None:
     """
-    Return True if fq_name matches any pattern in patterns.
+    Compile LIKE-style patterns into a single regex, or None when there are none.
 
-    Converts SQL LIKE wildcards (%) to fnmatch wildcards (*) before matching.
-    Case-insensitive to match Teradata NOT CASESPECIFIC behaviour.
+    Converts SQL LIKE wildcards (%) to fnmatch wildcards (*) and lower-cases
+    them, so the regex is matched against lower-cased names. Compiling once
+    per call keeps the per-edge exclude check to a single regex match.
 
     Arguments:
-      fq_name  - Fully-qualified object name (e.g. 'MyDB.MyTable')
       patterns - List of LIKE-style patterns (e.g. ['DFJ%', '%.temp_%'])
 
     Returns:
-      True if any pattern matches, False otherwise
+      Compiled regex matching any of the patterns, or None
     """
-    name_lower = fq_name.lower()
-    for pat in patterns:
-        # Convert SQL LIKE % to fnmatch *
-        fn_pat = pat.replace("%", "*").lower()
-        if fnmatch.fnmatch(name_lower, fn_pat):
-            return True
-    return False
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pat.replace("%", "*").lower()) for pat in patterns))
+
+
+def _matches_any(fq_name: str, pattern: re.Pattern) -> bool:
+    """
+    Return True if fq_name matches the compiled exclude pattern.
+
+    Case-insensitive to match Teradata NOT CASESPECIFIC behaviour.
+
+    Arguments:
+      fq_name - Fully-qualified object name (e.g. 'MyDB.MyTable')
+      pattern - Regex built by _compile_like_patterns
+
+    Returns:
+      True if any of the original patterns matches, False otherwise
+    """
+    return pattern.match(fq_name.lower()) is not None
 
 
 def _matches_container_any(container: str, patterns: list[str]) -> bool:
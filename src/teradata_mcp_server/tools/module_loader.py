@@ -38,6 +38,7 @@ class ModuleLoader:
         self._loaded_modules: dict[str, Any] = {}
         self._failed_modules: set = set()  # Track modules that failed to load
         self._required_modules: set = set()
+        self._functions: dict[str, Any] | None = None  # get_all_functions() result, built once per profile
 
     def determine_required_modules(self, config: dict) -> list[str]:
         """
@@ -66,6 +67,7 @@ class ModuleLoader:
                     logger.info(f"Pattern '{pattern}' matches module '{prefix}'")
 
         self._required_modules = required_modules
+        self._functions = None
         return list(required_modules)
 
     def load_module(self, module_name: str) -> Any | None:
@@ -125,9 +127,15 @@ class ModuleLoader:
         """
         Get all functions from loaded modules in the same format as the original td import.
 
+        The map is built once and reused: ``tools.__getattr__`` resolves every ``td.<name>``
+        lookup through it, so rebuilding it would re-scan every loaded module on each access.
+
         Returns:
             Dictionary mapping function names to function objects
         """
+        if self._functions is not None:
+            return self._functions
+
         all_functions: dict[str, Any] = {}
 
         # Load required modules
@@ -142,6 +150,7 @@ class ModuleLoader:
                 for name, cls in inspect.getmembers(module, inspect.isclass):
                     all_functions[name] = cls
 
+        self._functions = all_functions
         return all_functions
 
     def get_required_yaml_paths(self) -> list:
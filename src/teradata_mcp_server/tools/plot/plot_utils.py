@@ -67,7 +67,8 @@ def get_plot_json_data(conn, table_name, labels, columns, chart_type="line"):
             dataset["backgroundColor"] = colors
 
     chart_data = {"labels": [str(L) for L in labels], "datasets": datasets_}
-    logger.debug("Chart data: %s", json.dumps(chart_data, indent=2))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Chart data: %s", json.dumps(chart_data, indent=2))
 
     return create_response(
         data=chart_data,
@@ -151,7 +152,8 @@ def get_radar_plot_json_data(conn, table_name, labels, columns):
         )
 
     chart_data = {"labels": [str(L) for L in labels], "datasets": datasets_}
-    logger.debug("Chart data: %s", json.dumps(chart_data, indent=2))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Chart data: %s", json.dumps(chart_data, indent=2))
 
     return create_response(
         data=chart_data,
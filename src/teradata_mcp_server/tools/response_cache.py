@@ -0,0 +1,106 @@
+"""
+Thread-safe TTL + LRU cache for read-only metadata tool responses.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class ResponseCacheEntry:
+    """Cached tool response with expiration."""
+
+    value: Any
+    expires_at: float
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with TTL expiration and generation-based invalidation.
+
+    Keys are built by the caller. A generation counter is mixed into every key,
+    so ``invalidate()`` makes all existing entries unreachable in O(1); they are
+    evicted lazily as the LRU fills up or their TTL expires.
+
+    ``get()`` also returns the generation it looked in. Passing that to ``set()``
+    drops a value computed while an invalidation happened, so a read that
+    overlaps a write cannot store pre-write data under the new generation.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: int = 300):
+        self._cache: OrderedDict[tuple, ResponseCacheEntry] = OrderedDict()
+        self._lock = threading.RLock()
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._maxsize > 0 and self._ttl > 0
+
+    def get(self, key: tuple) -> tuple[Any | None, int]:
+        """Return (cached value or None if missing or expired, current generation)."""
+        with self._lock:
+            generation = self._generation
+            full_key = (generation, *key)
+            entry = self._cache.get(full_key)
+            if entry is None:
+                self._misses += 1
+                return None, generation
+
+            if time.time() >= entry.expires_at:
+                del self._cache[full_key]
+                self._misses += 1
+                return None, generation
+
+            self._cache.move_to_end(full_key)
+            self._hits += 1
+            return entry.value, generation
+
+    def set(self, key: tuple, value: Any, generation: int | None = None):
+        """Cache value for key, evicting the least recently used entry when full.
+
+        When generation is given (as returned by ``get()``), the value is only
+        stored if no invalidation happened since that lookup.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            full_key = (self._generation, *key)
+            self._cache[full_key] = ResponseCacheEntry(value=value, expires_at=time.time() + self._ttl)
+            self._cache.move_to_end(full_key)
+            while len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+    def invalidate(self):
+        """Invalidate all cached entries by bumping the generation counter."""
+        with self._lock:
+            self._generation += 1
+
+    def clear(self):
+        """Clear all cached entries."""
+        with self._lock:
+            self._cache.clear()
+
+    def size(self) -> int:
+        """Return current cache size."""
+        with self._lock:
+            return len(self._cache)
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "total_entries": len(self._cache),
+                "generation": self._generation,
+                "hits": self._hits,
+                "misses": self._misses,
+                "maxsize": self._maxsize,
+                "ttl_seconds": self._ttl,
+            }
@@ -1,4 +1,6 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Optional
 from urllib.parse import parse_qs, quote_plus, urlencode, urlparse
 
@@ -56,6 +58,7 @@ class TDConn:
             pool_size = int(os.getenv("TD_POOL_SIZE", "5"))
             max_overflow = int(os.getenv("TD_MAX_OVERFLOW", "10"))
             pool_timeout = int(os.getenv("TD_POOL_TIMEOUT", "30"))
+            pool_prefill = int(os.getenv("TD_POOL_PREFILL", "0"))
         else:
             # Use settings object
             self._rate_limiter = RateLimiter(
@@ -71,6 +74,7 @@ class TDConn:
             pool_size = settings.pool_size
             max_overflow = settings.max_overflow
             pool_timeout = settings.pool_timeout
+            pool_prefill = settings.pool_prefill
 
         # Parse connection URL
         parsed_url = urlparse(connection_url)
@@ -108,6 +112,9 @@ class TDConn:
             f"teradatasql://{user}:{password}@{self._base_host}:{self._base_port}/{self._base_db}?{main_query}"
         )
 
+        self._pool_size = pool_size
+        self._pool_prefill = pool_prefill
+
         try:
             self.engine = create_engine(
                 sqlalchemy_url,
@@ -122,6 +129,39 @@ class TDConn:
             logger.error(f"Error creating database engine: {e}")
             self.engine = None
 
+    def prefill_pool(self, count: int | None = None) -> int:
+        """Open up to `count` pooled connections concurrently so they are ready for first use.
+
+        Logons are run in parallel, so startup costs roughly one handshake instead of
+        `count` sequential ones. Connections that fail are skipped rather than aborting
+        startup. Returns the number of connections added to the pool.
+        """
+        if self.engine is None:
+            return 0
+        count = min(self._pool_prefill if count is None else count, self._pool_size)
+        if count <= 0:
+            return 0
+
+        engine = self.engine
+
+        def _connect(_):
+            try:
+                return engine.connect()
+            except Exception as e:
+                logger.warning(f"Connection pool prefill: failed to open connection: {e}")
+                return None
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix="td-pool-prefill") as ex:
+            conns = [c for c in ex.map(_connect, range(count)) if c is not None]
+        # Returning the connections checks them back into the pool for reuse
+        for conn in conns:
+            conn.close()
+        logger.info(
+            f"Connection pool prefilled with {len(conns)}/{count} connections in {time.perf_counter() - start:.2f}s"
+        )
+        return len(conns)
+
     # Destructor
     #     It will close the SQLAlchemy connection and engine
     def close(self):
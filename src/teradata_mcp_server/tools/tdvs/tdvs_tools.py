@@ -48,7 +48,7 @@ def handle_tdvs_get_health(
         create_teradataml_context()
         df = VSManager.health()
         df1 = df.to_pandas()
-        data = df1.to_json(orient="records", indent=4)
+        data = df1.to_json(orient="records")
         metadata = {"tool_name": "tdvs_get_health"}
         return create_response(json.loads(data), metadata)
     except Exception as e:
@@ -68,7 +68,7 @@ def handle_tdvs_list(
             data = "[]"
         else:
             df1 = df.to_pandas()
-            data = df1.to_json(orient="records", indent=4)
+            data = df1.to_json(orient="records")
         metadata = {"tool_name": "tdvs_list"}
         return create_response(json.loads(data), metadata)
     except Exception as e:
@@ -82,7 +82,7 @@ def handle_tdvs_get_details(conn: TeradataConnection, vs_name: str, *args, **kwa
         vs = VectorStore(vs_name)
         df = vs.get_details()
         df1 = df.to_pandas()
-        data = df1.to_json(orient="records", indent=4)
+        data = df1.to_json(orient="records")
         metadata = {"tool_name": "tdvs_get_details"}
         return create_response(json.loads(data), metadata)
     except Exception as e:
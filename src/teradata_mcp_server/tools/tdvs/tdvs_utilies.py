@@ -1,6 +1,6 @@
 import logging
 import os
-from functools import lru_cache
+import threading
 from typing import Union
 from urllib.parse import urlparse
 
@@ -8,7 +8,6 @@ import requests  # type: ignore[import-untyped]
 from teradatagenai import VSManager
 from teradataml import create_context, get_context, set_auth_token
 
-from ..td_connect import TDConn
 from .constants import DATABASE_URI, TD_PAT_TOKEN, TD_PEM_FILE, TD_VS_BASE_URL
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -17,13 +16,28 @@ logger = logging.getLogger(__name__)
 logger.setLevel(log_level)
 
 
+# Set once the teradataml context and Vector Store auth token are in place. The lock keeps
+# concurrent tool calls from each running create_context/set_auth_token on first use.
+_CONTEXT_READY = False
+_CONTEXT_LOCK = threading.Lock()
+
+
 # --------------- VS Service Utilies -----------------------------#
-@lru_cache(maxsize=1)
 def create_teradataml_context():
     """
     Create the appropriate credentials for TeradataML context based on the type of authentication.
     """
-    td_conn = TDConn()
+    global _CONTEXT_READY
+    if _CONTEXT_READY:
+        return
+    with _CONTEXT_LOCK:
+        if not _CONTEXT_READY:
+            _build_teradataml_context()
+            _CONTEXT_READY = True
+
+
+def _build_teradataml_context():
+    """Create the teradataml context (if missing) and set the Vector Store auth token."""
     if DATABASE_URI is None:
         raise ValueError("DATABASE_URI environment variable is not set.")
 
@@ -45,9 +59,12 @@ def create_teradataml_context():
 
 
 # -------------------------------------------------------------
-#  Reconnect logic: clear cache + disconnect session → auto-reconnect
+#  Reconnect logic: reset ready flag + disconnect session → auto-reconnect
 # -------------------------------------------------------------
 def refresh_vectorstore_session():
-    VSManager.disconnect()  # Release the previous Vector Store session
-    create_teradataml_context.cache_clear()  # Clear the LRU cache
-    return create_teradataml_context()  # Re-establish and return the new session
+    global _CONTEXT_READY
+    with _CONTEXT_LOCK:
+        VSManager.disconnect()  # Release the previous Vector Store session
+        _CONTEXT_READY = False
+        _build_teradataml_context()  # Re-establish the session
+        _CONTEXT_READY = True
@@ -12,6 +12,7 @@ import hashlib
 import json
 import logging
 from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Optional
@@ -33,8 +34,15 @@ def serialize_teradata_types(obj: Any) -> Any:
         A JSON-native type (str, int, float, bool, None) or an
         ISO-formatted date string.
     """
-    if obj is None:
-        return None
+    # Exact-type checks first: nearly every cell is one of these, and type() identity
+    # is cheaper than an isinstance walk over the union types below
+    obj_type = type(obj)
+    if obj is None or obj_type is str or obj_type is int or obj_type is float or obj_type is bool:
+        return obj
+    if obj_type is Decimal:
+        return float(obj)
+    if obj_type is datetime or obj_type is date:
+        return obj.isoformat()
     if isinstance(obj, date | datetime):
         return obj.isoformat()
     if isinstance(obj, Decimal):
@@ -46,11 +54,28 @@ def rows_to_json(cursor_description: Any, rows: list[Any]) -> list[dict[str, Any
     """Convert DB rows into JSON objects using column names as keys."""
     if not cursor_description or not rows:
         return []
-    columns = [col[0] for col in cursor_description]
-    out: list[dict[str, Any]] = []
-    for row in rows:
-        out.append({col: serialize_teradata_types(val) for col, val in zip(columns, row)})
-    return out
+    columns = tuple(col[0] for col in cursor_description)
+    serialize = serialize_teradata_types
+    # dict(zip(...)) over map() builds each row in C rather than through a comprehension frame
+    return [dict(zip(columns, map(serialize, row))) for row in rows]
+
+
+def iter_rows_json(cur: Any, arraysize: int = 1000) -> Iterator[dict[str, Any]]:
+    """Yield an executed cursor's rows as JSON objects, fetching ``arraysize`` rows at a time.
+
+    Unlike ``rows_to_json(cur.description, cur.fetchall())`` the raw driver rows are never
+    all buffered at once; only the current batch is held alongside the converted output.
+    """
+    if not cur.description:
+        return
+    columns = tuple(col[0] for col in cur.description)
+    serialize = serialize_teradata_types
+    while True:
+        batch = cur.fetchmany(arraysize)
+        if not batch:
+            return
+        for row in batch:
+            yield dict(zip(columns, map(serialize, row)))
 
 
 def _make_serialisable(obj: Any) -> Any:
@@ -71,8 +96,14 @@ def _make_serialisable(obj: Any) -> Any:
         A recursively sanitised copy whose leaves are all
         ``str | int | float | bool | None``.
     """
-    if obj is None:
-        return None
+    # Exact-type fast paths for the JSON-native shapes that make up almost every response
+    obj_type = type(obj)
+    if obj is None or obj_type is str or obj_type is int or obj_type is float or obj_type is bool:
+        return obj
+    if obj_type is dict:
+        return {k: _make_serialisable(v) for k, v in obj.items()}
+    if obj_type is list:
+        return [_make_serialisable(item) for item in obj]
     if isinstance(obj, str | int | float | bool):
         return obj
     if isinstance(obj, date | datetime):
@@ -16,7 +16,12 @@ from importlib.resources import files as pkg_files
 from pathlib import Path
 from typing import Any
 
-import yaml
+try:
+    # orjson encodes tool responses several times faster than the stdlib; it is optional
+    import orjson
+except ImportError:
+    orjson = None
+
 
 logger = logging.getLogger("teradata_mcp_server")
 
@@ -152,22 +157,35 @@ def setup_logging(level: str = "WARNING", transport: str = "stdio") -> logging.L
 
 
 # -------------------- Response formatting -------------------- #
+def _dumps_pretty(obj: Any) -> str:
+    """Pretty-print obj as JSON (non-ASCII kept as is), stringifying unsupported values."""
+    if orjson is not None:
+        try:
+            # Datetimes pass through to default=str so the text matches the json fallback
+            return orjson.dumps(
+                obj,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+
+
 def format_text_response(text: Any):
     """Format a return value into FastMCP content list.
     Strings are pretty-printed if JSON; other values are stringified.
     """
-    import json
-
     from mcp import types
 
     if isinstance(text, str):
         try:
-            parsed = json.loads(text)
-            return [types.TextContent(type="text", text=json.dumps(parsed, indent=2, ensure_ascii=False))]
+            parsed = orjson.loads(text) if orjson is not None else json.loads(text)
+            return [types.TextContent(type="text", text=_dumps_pretty(parsed))]
         except json.JSONDecodeError:
             return [types.TextContent(type="text", text=str(text))]
     if isinstance(text, dict | list):
-        return [types.TextContent(type="text", text=json.dumps(text, indent=2, ensure_ascii=False, default=str))]
+        return [types.TextContent(type="text", text=_dumps_pretty(text))]
     return [types.TextContent(type="text", text=str(text))]
 
 
@@ -261,7 +279,7 @@ def load_all_objects(working_dir: Path | None = None) -> dict[str, Any]:
                     for yml_file in subdir.iterdir():
                         if yml_file.is_file() and yml_file.name.endswith(".yml"):
                             try:
-                                loaded = yaml.safe_load(yml_file.read_text(encoding="utf-8")) or {}
+                                loaded = config_loader.safe_load_yaml(yml_file.read_text(encoding="utf-8")) or {}
                                 # Filter by allowed object types
                                 filtered = {
                                     k: v
@@ -283,7 +301,7 @@ def load_all_objects(working_dir: Path | None = None) -> dict[str, Any]:
             continue
         try:
             with open(yml_file, encoding="utf-8") as f:
-                loaded = yaml.safe_load(f) or {}
+                loaded = config_loader.safe_load_yaml(f) or {}
                 # Filter by allowed object types
                 filtered = {k: v for k, v in loaded.items() if isinstance(v, dict) and v.get("type") in allowed_types}
                 if filtered:
@@ -0,0 +1,197 @@
+"""Unit tests for the DSA REST client: GET cache, ETag revalidation, circuit breaker, coalescing and bulkhead."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from teradata_mcp_server.tools.bar import dsa_client as dc
+from teradata_mcp_server.tools.bar.dsa_client import DSAAPIError, DSACircuitOpenError, DSAClient
+
+COMPONENT = "dsa/components/backup-applications/disk-file-system"
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int = 200, body: dict | None = None, etag: str | None = None):
+        self.status_code = status_code
+        self.content = json.dumps(body).encode() if body is not None else b""
+        self.text = self.content.decode()
+        self.headers = {"ETag": etag} if etag else {}
+
+
+class _FakeSession:
+    """Stands in for requests.Session.request; replays scripted responses and records each call"""
+
+    def __init__(self, *responses: _FakeResponse):
+        self.responses = list(responses)
+        self.calls: list[dict] = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        if len(self.responses) > 1:
+            return self.responses.pop(0)
+        return self.responses[0]
+
+
+def _client(session: _FakeSession) -> DSAClient:
+    client = DSAClient(base_url="http://dsa.example:9090/", username="u", password="p")
+    client._session.request = session
+    return client
+
+
+def test_component_get_is_served_from_cache_as_a_private_copy():
+    session = _FakeSession(_FakeResponse(body={"fileSystems": [{"fileSystemPath": "/a"}]}))
+    client = _client(session)
+
+    first = client._make_request("GET", COMPONENT)
+    first["fileSystems"].clear()
+    second = client._make_request("GET", COMPONENT)
+
+    assert len(session.calls) == 1
+    assert second == {"fileSystems": [{"fileSystemPath": "/a"}]}
+
+
+def test_non_component_get_is_not_cached():
+    session = _FakeSession(_FakeResponse(body={"status": "RUNNING"}))
+    client = _client(session)
+    client._make_request("GET", "dsa/jobs/job1/status")
+    client._make_request("GET", "dsa/jobs/job1/status")
+    assert len(session.calls) == 2
+
+
+def test_write_clears_the_cache():
+    session = _FakeSession(
+        _FakeResponse(body={"fileSystems": []}),
+        _FakeResponse(body={"status": "CONFIG_DISK_FILE_SYSTEM_SUCCESSFUL"}),
+        _FakeResponse(body={"fileSystems": [{"fileSystemPath": "/a"}]}),
+    )
+    client = _client(session)
+    client._make_request("GET", COMPONENT)
+    client._make_request("POST", COMPONENT, data={"fileSystems": [{"fileSystemPath": "/a"}]})
+    assert client._make_request("GET", COMPONENT) == {"fileSystems": [{"fileSystemPath": "/a"}]}
+    assert [call["method"] for call in session.calls] == ["GET", "POST", "GET"]
+
+
+def test_expired_entry_is_revalidated_with_its_etag():
+    session = _FakeSession(_FakeResponse(body={"fileSystems": []}, etag='"v1"'), _FakeResponse(304))
+    client = _client(session)
+    client._make_request("GET", COMPONENT)
+    client.get_cache_ttl = 0.01
+    time.sleep(0.02)
+
+    assert client._make_request("GET", COMPONENT) == {"fileSystems": []}
+    assert session.calls[1]["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_not_modified_without_a_held_body_refetches_unconditionally():
+    session = _FakeSession(_FakeResponse(304), _FakeResponse(body={"fileSystems": []}))
+    client = _client(session)
+    assert client._make_request("GET", COMPONENT) == {"fileSystems": []}
+    assert len(session.calls) == 2
+    assert "If-None-Match" not in (session.calls[1]["headers"] or {})
+
+
+def test_circuit_opens_after_consecutive_failures():
+    session = _FakeSession(_FakeResponse(500))
+    client = _client(session)
+    for _ in range(dc.CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(DSAAPIError):
+            client._make_request("GET", "dsa/jobs")
+
+    with pytest.raises(DSACircuitOpenError):
+        client._make_request("GET", "dsa/jobs")
+    assert len(session.calls) == dc.CIRCUIT_FAILURE_THRESHOLD
+
+
+def test_half_open_circuit_lets_a_single_trial_through():
+    session = _FakeSession(_FakeResponse(500))
+    client = _client(session)
+    for _ in range(dc.CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(DSAAPIError):
+            client._make_request("GET", "dsa/jobs")
+    client._cb_opened_at -= client._cb_reset_seconds  # the reset window has passed
+
+    client._check_circuit()  # the trial call
+    with pytest.raises(DSACircuitOpenError):
+        client._check_circuit()  # rejected while the trial is in flight
+
+    client._record_success()
+    assert client._cb_state == "closed"
+    client._check_circuit()
+
+
+def test_failed_trial_reopens_the_circuit_for_longer():
+    session = _FakeSession(_FakeResponse(500))
+    client = _client(session)
+    for _ in range(dc.CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(DSAAPIError):
+            client._make_request("GET", "dsa/jobs")
+    first_window = client._cb_reset_seconds
+    client._cb_opened_at -= first_window
+
+    with pytest.raises(DSAAPIError):
+        client._make_request("GET", "dsa/jobs")
+    assert client._cb_state == "open"
+    assert client._cb_reset_seconds > first_window
+
+
+def test_cached_get_is_served_while_the_circuit_is_open():
+    session = _FakeSession(_FakeResponse(body={"fileSystems": []}))
+    client = _client(session)
+    client._make_request("GET", COMPONENT)
+    client._cb_state, client._cb_opened_at = "open", time.monotonic()
+
+    assert client._make_request("GET", COMPONENT) == {"fileSystems": []}
+    with pytest.raises(DSACircuitOpenError):
+        client._make_request("GET", "dsa/jobs")
+
+
+def test_identical_concurrent_gets_share_one_request():
+    release = threading.Event()
+    session = _FakeSession(_FakeResponse(body={"status": "RUNNING"}))
+    client = _client(session)
+
+    def slow_request(**kwargs):
+        release.wait(5)
+        return session(**kwargs)
+
+    client._session.request = slow_request
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client._make_request("GET", "dsa/jobs/job1"))) for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(session.calls) == 1
+    assert results == [{"status": "RUNNING"}] * 3
+
+
+def test_submit_limits_concurrency_per_endpoint_group():
+    lock = threading.Lock()
+    running = peak = 0
+
+    def tracked_request(**kwargs):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return _FakeResponse(body={"status": "OK"})
+
+    client = _client(_FakeSession(_FakeResponse()))
+    client._session.request = tracked_request
+    client.endpoint_max = 2
+    try:
+        futures = [client.submit("GET", f"dsa/jobs/job{i}/status") for i in range(6)]
+        assert all(future.result(5) == {"status": "OK"} for future in futures)
+    finally:
+        client.close()
+    assert peak == 2
@@ -0,0 +1,77 @@
+"""Unit tests for the metadata tool response cache."""
+
+from teradata_mcp_server.tools import response_cache as rc
+from teradata_mcp_server.tools.response_cache import ResponseCache
+
+
+def test_get_returns_stored_value_and_counts_hits():
+    cache = ResponseCache(maxsize=4, ttl_seconds=60)
+    assert cache.get(("base_tableList", "demo"))[0] is None
+    cache.set(("base_tableList", "demo"), "tables")
+    assert cache.get(("base_tableList", "demo"))[0] == "tables"
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rc.time, "time", lambda: now[0])
+    cache = ResponseCache(maxsize=4, ttl_seconds=10)
+    cache.set(("k",), "v")
+    now[0] += 9.9
+    assert cache.get(("k",))[0] == "v"
+    now[0] += 0.1
+    assert cache.get(("k",))[0] is None
+    assert cache.size() == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(maxsize=2, ttl_seconds=60)
+    cache.set(("a",), 1)
+    cache.set(("b",), 2)
+    cache.get(("a",))
+    cache.set(("c",), 3)
+    assert cache.get(("a",))[0] == 1
+    assert cache.get(("b",))[0] is None
+    assert cache.get(("c",))[0] == 3
+
+
+def test_invalidate_hides_existing_entries():
+    cache = ResponseCache(maxsize=4, ttl_seconds=60)
+    cache.set(("k",), "old")
+    cache.invalidate()
+    assert cache.get(("k",))[0] is None
+    cache.set(("k",), "new")
+    assert cache.get(("k",))[0] == "new"
+
+
+def test_set_drops_value_computed_across_an_invalidation():
+    cache = ResponseCache(maxsize=4, ttl_seconds=60)
+    _, generation = cache.get(("k",))
+    cache.invalidate()  # a write ran while the read was in flight
+    cache.set(("k",), "stale", generation)
+    assert cache.get(("k",))[0] is None
+
+    _, generation = cache.get(("k",))
+    cache.set(("k",), "fresh", generation)
+    assert cache.get(("k",))[0] == "fresh"
+
+
+def test_disabled_cache_stores_nothing():
+    for cache in (ResponseCache(maxsize=0, ttl_seconds=60), ResponseCache(maxsize=4, ttl_seconds=0)):
+        assert not cache.enabled
+        cache.set(("k",), "v")
+        assert cache.size() == 0
+
+
+def test_only_declared_read_only_tools_keep_the_cache():
+    from teradata_mcp_server.app import _may_modify_metadata
+
+    assert not _may_modify_metadata("base_readQuery", (), {"sql": "SELECT * FROM dbc.tables"})
+    assert _may_modify_metadata("base_readQuery", (), {"sql": "DROP TABLE demo.t"})
+    assert not _may_modify_metadata("dba_tableSpace", (), {})
+    assert not _may_modify_metadata("tdvs_list", (), {})
+    for writer in ("tdvs_create", "tdvs_destroy", "fs_createDataset", "sql_Execute_Full_Pipeline"):
+        assert _may_modify_metadata(writer, (), {})
+    # Tools with no annotations at all count as writes
+    assert _may_modify_metadata("custom_unknownTool", (), {})